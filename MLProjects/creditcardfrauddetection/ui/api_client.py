@@ -3,6 +3,7 @@ Utility functions for the Streamlit UI to interact with the API.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import streamlit as st
 import traceback
@@ -24,6 +25,11 @@ class FraudDetectionAPI:
             "Content-Type": "application/json",
             "X-API-Key": api_key
         }
+        # Pooled keep-alive session so repeated calls reuse TCP connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def detect_fraud(self, transaction_data):
         """
@@ -177,13 +183,13 @@ class FraudDetectionAPI:
         """
         try:
             if method == "GET":
-                response = requests.get(url, headers=self.headers, timeout=timeout)
+                response = self.session.get(url, headers=self.headers, timeout=timeout)
             elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data, timeout=timeout)
+                response = self.session.post(url, headers=self.headers, json=data, timeout=timeout)
             elif method == "PUT":
-                response = requests.put(url, headers=self.headers, json=data, timeout=timeout)
+                response = self.session.put(url, headers=self.headers, json=data, timeout=timeout)
             elif method == "DELETE":
-                response = requests.delete(url, headers=self.headers, timeout=timeout)
+                response = self.session.delete(url, headers=self.headers, timeout=timeout)
             else:
                 st.error(f"Unsupported HTTP method: {method}")
                 return None
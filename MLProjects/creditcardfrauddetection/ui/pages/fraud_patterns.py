@@ -5,7 +5,7 @@ Enhanced with grid view, CRUD operations, filtering, and search functionality.
 
 import streamlit as st
 import pandas as pd
-import json
+import orjson
 import datetime
 import uuid
 import sys
@@ -17,6 +17,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import api_client from parent directory
 from api_client import get_api_client
 
+def _dumps(obj):
+    """Pretty-print a pattern as JSON (orjson is several times faster than the stdlib encoder)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+_loads = orjson.loads
+
 def display_fraud_patterns():
     """Display fraud patterns in a grid with search, filter, and CRUD operations."""
     # Initialize session state
@@ -124,7 +130,11 @@ def display_fraud_patterns():
 
 def apply_filters(patterns, search_term, fraud_type_filter):
     """Apply search and filter criteria to patterns."""
-    filtered = patterns.copy()
+    # Nothing to filter on (the common first-load case) - hand the list straight back
+    if not search_term and fraud_type_filter == "All":
+        return patterns
+
+    filtered = patterns
     
     # Apply search filter
     if search_term:
@@ -279,7 +289,11 @@ def add_pattern_form():
         
         pattern_details = st.text_area(
             "Pattern Details",
-            value=json.dumps(default_pattern, indent=2),
+            value=_cached_pattern_json(
+                "last_default_json",
+                (fraud_type, merchant_category, transaction_type, amount_threshold),
+                default_pattern
+            ),
             height=150,
             help="JSON format describing the fraud pattern"
         )
@@ -301,7 +315,7 @@ def add_pattern_form():
             
             try:
                 # Validate JSON
-                pattern_json = json.loads(pattern_details)
+                pattern_json = _loads(pattern_details)
                 pattern_json["fraud_type"] = fraud_type  # Ensure consistency
                 
                 # Create new pattern
@@ -328,11 +342,20 @@ def add_pattern_form():
                     else:
                         st.error("❌ Failed to add pattern. Please check API connection.")
                         
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 st.error(f"❌ Invalid JSON format: {str(e)}")
             except Exception as e:
                 st.error(f"❌ Error adding pattern: {str(e)}")
 
+def _cached_pattern_json(state_key, cache_key, pattern_obj):
+    """Return the pretty-printed JSON for a pattern, reusing the last result while its inputs are unchanged."""
+    cached = st.session_state.get(state_key)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+    pattern_json = _dumps(pattern_obj)
+    st.session_state[state_key] = (cache_key, pattern_json)
+    return pattern_json
+
 def show_pattern_details_popup(pattern):
     """Show pattern details in a popup-style modal."""
     st.markdown("---")
@@ -460,7 +483,11 @@ def edit_pattern_popup(pattern):
         
         pattern_details = st.text_area(
             "Pattern Details",
-            value=json.dumps(current_pattern, indent=2),
+            value=_cached_pattern_json(
+                "last_edit_json",
+                (pattern.get('id'), fraud_type, merchant_category, transaction_type, amount_threshold),
+                current_pattern
+            ),
             height=150,
             help="JSON format describing the fraud pattern"
         )
@@ -475,14 +502,15 @@ def edit_pattern_popup(pattern):
         
         if cancel_button:
             st.session_state.pop('editing_pattern', None)
+            st.session_state.pop('last_edit_json', None)
             st.rerun()
         
         if preview_button:
             st.markdown("### 👁️ Preview")
             try:
-                preview_pattern = json.loads(pattern_details)
+                preview_pattern = _loads(pattern_details)
                 st.json(preview_pattern)
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 st.error(f"❌ Invalid JSON: {str(e)}")
         
         if save_button:
@@ -492,7 +520,7 @@ def edit_pattern_popup(pattern):
             
             try:
                 # Validate JSON
-                pattern_json = json.loads(pattern_details)
+                pattern_json = _loads(pattern_details)
                 pattern_json["fraud_type"] = fraud_type  # Ensure consistency
                 
                 # Create updated pattern
@@ -516,11 +544,12 @@ def edit_pattern_popup(pattern):
                         if updated_patterns is not None:
                             st.session_state.fraud_patterns = updated_patterns
                         st.session_state.pop('editing_pattern', None)
+                        st.session_state.pop('last_edit_json', None)
                         st.rerun()
                     else:
                         st.error("❌ Failed to update pattern. Please check API connection.")
                         
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 st.error(f"❌ Invalid JSON format: {str(e)}")
             except Exception as e:
                 st.error(f"❌ Error updating pattern: {str(e)}")
@@ -6,15 +6,341 @@ This page provides system health metrics, performance monitoring, and logs.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 import datetime
+from types import MappingProxyType
 from api_client import get_api_client
 
+# Set on the first chart build, once plotly has been imported
+USING_RESAMPLER = None
+
+def _graph_objects():
+    """Import plotly.graph_objects on first use so it stays off the page's cold-start path."""
+    global USING_RESAMPLER
+    import plotly.graph_objects as go
+    if USING_RESAMPLER is None:
+        # Downsample long series to viewport resolution when plotly-resampler is available
+        try:
+            from plotly_resampler import register_plotly_resampler
+            register_plotly_resampler(mode='auto', default_n_shown_samples=1000)
+            USING_RESAMPLER = True
+        except ImportError:
+            USING_RESAMPLER = False
+    return go
+
+@st.cache_resource(show_spinner=False)
+def _api_client():
+    """API client shared across reruns so its HTTP connection pool is reused."""
+    return get_api_client()
+
+# Every widget interaction reruns this page top to bottom, so the API round-trips
+# are cached for a short window instead of being repeated on each rerun.
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_metrics():
+    """Fetch /api/v1/metrics, cached for 15 seconds."""
+    return _api_client().get_metrics()
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_llm_status():
+    """Fetch /api/v1/llm/status, cached for 15 seconds."""
+    return _api_client().get_llm_status()
+
+# Upper bound on points per series handed to Plotly
+MAX_PLOT_POINTS = 1000
+
+# Sample logs shown in the System Logs section
+_SAMPLE_LOGS = (
+    MappingProxyType({"timestamp": "2025-05-21 10:15:23", "level": "INFO", "type": "API", "message": "Transaction tx_1000 processed successfully"}),
+    MappingProxyType({"timestamp": "2025-05-21 10:14:12", "level": "INFO", "type": "API", "message": "Transaction tx_999 processed successfully"}),
+    MappingProxyType({"timestamp": "2025-05-21 10:12:45", "level": "WARNING", "type": "API", "message": "High response time detected for transaction tx_998"}),
+    MappingProxyType({"timestamp": "2025-05-21 10:10:33", "level": "INFO", "type": "Model", "message": "Model prediction completed for transaction tx_997"}),
+    MappingProxyType({"timestamp": "2025-05-21 10:08:21", "level": "ERROR", "type": "Database", "message": "Failed to process transaction tx_996: Database connection timeout"}),
+    MappingProxyType({"timestamp": "2025-05-21 10:05:17", "level": "INFO", "type": "API", "message": "Transaction tx_995 processed successfully"}),
+    MappingProxyType({"timestamp": "2025-05-21 10:03:42", "level": "DEBUG", "type": "Model", "message": "Vector similarity calculation took 123ms for transaction tx_994"}),
+    MappingProxyType({"timestamp": "2025-05-21 10:01:19", "level": "INFO", "type": "Security", "message": "Suspicious IP address detected for transaction tx_993"}),
+)
+
+# LLM service types that are simulated responses
+_MOCK_TYPES = frozenset({"enhanced_mock", "basic_mock"})
+
+# How each LLM service type is shown: (status element, label, status text)
+_LLM_DISPLAY = {
+    "openai": (st.success, "Using OpenAI API", "Connected to OpenAI API"),
+    "local": (st.info, "Using Local LLM", "Using local model (no API costs)"),
+    **{
+        mock_type: (st.warning, "Using Mock LLM", "Using simulated responses (demonstration mode)")
+        for mock_type in _MOCK_TYPES
+    },
+}
+
+# Metrics reported per model by /api/v1/metrics, in display order
+_MODEL_METRIC_NAMES = ("accuracy", "precision", "recall", "f1_score", "auc")
+
+# Log levels shown for each "Log Level" selection (the selected level and above)
+_ALLOWED_LEVELS = {
+    "INFO": frozenset({"INFO", "WARNING", "ERROR"}),
+    "WARNING": frozenset({"WARNING", "ERROR"}),
+    "ERROR": frozenset({"ERROR"}),
+    "DEBUG": frozenset({"INFO", "WARNING", "ERROR", "DEBUG"}),
+}
+
+@st.cache_data(show_spinner=False)
+def _fallback_model_metrics():
+    """Sample model comparison metrics used when the API has none."""
+    return pd.DataFrame({
+        "Metric": ["Accuracy", "Precision", "Recall", "F1 Score", "AUC"],
+        "ML Model": [0.952, 0.923, 0.897, 0.910, 0.964],
+        "LLM+RAG": [0.968, 0.942, 0.921, 0.931, 0.978],
+        "Combined": [0.975, 0.958, 0.943, 0.950, 0.986]
+    })
+
+# Row highlight per log level in the System Logs table
+_LOG_LEVEL_STYLES = {
+    "ERROR": "background-color: #ffebee",
+    "WARNING": "background-color: #fff8e1",
+    "INFO": "background-color: #e3f2fd",
+}
+
+def _sample_rng(dates):
+    """Random generator seeded from the date range so cached sample data is reproducible."""
+    key = (dates[0], dates[-1]) if len(dates) else ()
+    return np.random.default_rng(hash(key) & 0xFFFFFFFF)
+
+def _downsample(df, n_max=MAX_PLOT_POINTS):
+    """Keep at most n_max evenly strided rows so chart render time stays flat for long ranges."""
+    if len(df) <= n_max:
+        return df
+    step = -(-len(df) // n_max)
+    return df.iloc[::step]
+
+def _sample_frame(dates, columns, loc, scale, rng):
+    """Draw every normally distributed column in one call and build the frame from the matrix."""
+    mat = rng.standard_normal((len(dates), len(columns))) * np.asarray(scale) + np.asarray(loc)
+    df = pd.DataFrame(mat, columns=columns)
+    df.insert(0, 'Date', dates)
+    return df
+
+@st.cache_data(show_spinner=False)
+def _perf_df(dates):
+    """Sample API performance metrics for the selected date range."""
+    rng = _sample_rng(dates)
+    df = _sample_frame(
+        dates,
+        ['Response Time (ms)', 'Request Count'],
+        loc=[250, 5000],
+        scale=[25, 500],
+        rng=rng
+    )
+    # Error rate is beta distributed, so it is drawn separately
+    df.insert(2, 'Error Rate (%)', rng.beta(1, 100, size=len(dates)) * 100)
+    df['Request Count'] = df['Request Count'].astype(int)
+    return _downsample(df)
+
+@st.cache_data(show_spinner=False)
+def _model_metrics_df(dates):
+    """Sample model metrics over time for the selected date range."""
+    return _downsample(_sample_frame(
+        dates,
+        ['Accuracy', 'Precision', 'Recall', 'F1 Score'],
+        loc=[0.95, 0.92, 0.89, 0.91],
+        scale=[0.01, 0.02, 0.02, 0.015],
+        rng=_sample_rng(dates)
+    ))
+
+@st.cache_data(show_spinner=False)
+def _resource_df(dates):
+    """Sample resource utilization for the selected date range."""
+    return _downsample(_sample_frame(
+        dates,
+        ['CPU Usage (%)', 'Memory Usage (%)', 'Disk I/O (%)'],
+        loc=[40, 60, 30],
+        scale=[15, 10, 12],
+        rng=_sample_rng(dates)
+    ))
+
+# Figure construction is cached as well so tab switches and unrelated widget
+# changes reuse the built figure. Traces are built with graph_objects from numpy
+# arrays, which skips the long-form DataFrame reshaping plotly.express does;
+# line traces use WebGL (Scattergl) so rendering is offloaded to the GPU.
+@st.cache_data(ttl=300, show_spinner=False)
+def _line_fig(df, column, title):
+    """Line chart of one column of a date-indexed sample frame."""
+    go = _graph_objects()
+    fig = go.Figure(go.Scattergl(x=df['Date'].values, y=df[column].values, mode='lines'))
+    fig.update_layout(title=title, xaxis_title="Date", yaxis_title=column)
+    return fig
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _bar_fig(df, column, title):
+    """Bar chart of one column of a date-indexed sample frame."""
+    go = _graph_objects()
+    fig = go.Figure(go.Bar(x=df['Date'].values, y=df[column].values))
+    fig.update_layout(title=title, xaxis_title="Date", yaxis_title=column)
+    return fig
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _model_metrics_fig(df, selected_metrics):
+    """Model metrics over time for the selected metric columns."""
+    go = _graph_objects()
+    dates = df['Date'].values
+    fig = go.Figure([
+        go.Scattergl(x=dates, y=df[metric].values, mode='lines', name=metric)
+        for metric in selected_metrics
+    ])
+    fig.update_layout(
+        title='Model Performance Metrics Over Time',
+        xaxis_title="Date",
+        yaxis_title="Score",
+        yaxis=dict(range=[0.85, 1.0])
+    )
+    return fig
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _parse_iso(ts):
+    """Format an ISO-8601 API timestamp for display."""
+    return datetime.datetime.fromisoformat(ts.replace("Z", "+00:00")).strftime('%Y-%m-%d %H:%M:%S')
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _model_comparison_fig(model_metrics, timestamp=None):
+    """Grouped bar chart comparing models, annotated with the metrics timestamp when known."""
+    go = _graph_objects()
+    metric_names = model_metrics["Metric"].values
+    traces = [
+        go.Bar(x=metric_names, y=model_metrics[column].values, name=column)
+        for column in model_metrics.columns[1:]
+    ]
+    
+    layout = dict(
+        title="Model Performance Comparison",
+        xaxis_title="Metric",
+        yaxis_title="Score",
+        yaxis=dict(range=[0.85, 1.0]),
+        barmode='group'
+    )
+    
+    # Add last updated time if available
+    if timestamp:
+        layout["annotations"] = [
+            dict(
+                text=f"Last updated: {_parse_iso(timestamp)}",
+                showarrow=False,
+                x=0.5,
+                y=-0.15,
+                xref="paper",
+                yref="paper"
+            )
+        ]
+    
+    return go.Figure(data=traces, layout=go.Layout(**layout))
+
+# Widget-driven sections run as fragments so changing one of their widgets only
+# reruns that section instead of the whole page.
+@st.fragment
+def _render_model_metrics(model_metrics_df):
+    """Metric picker and chart for the model-metrics-over-time section."""
+    # Select which metrics to display
+    selected_metrics = st.multiselect(
+        "Select metrics to display",
+        options=['Accuracy', 'Precision', 'Recall', 'F1 Score'],
+        default=['Accuracy', 'F1 Score']
+    )
+    
+    if selected_metrics:
+        st.plotly_chart(_model_metrics_fig(model_metrics_df, tuple(selected_metrics)), use_container_width=True)
+    else:
+        st.info("Please select at least one metric to display.")
+
+@st.fragment
+def _render_logs(logs):
+    """Log level/type filters and the filtered log entries."""
+    # Log level selector
+    log_level = st.selectbox("Log Level", ["INFO", "WARNING", "ERROR", "DEBUG"])
+    
+    # Log type selector
+    log_type = st.selectbox("Log Type", ["All", "API", "Model", "Database", "Security"])
+    
+    # Filter logs by selected level and type in a single pass
+    allowed_levels = _ALLOWED_LEVELS[log_level]
+    filtered_logs = [
+        log for log in logs
+        if log["level"] in allowed_levels and (log_type == "All" or log["type"] == log_type)
+    ]
+    
+    # Display all matching logs in one table, highlighted by level
+    if filtered_logs:
+        logs_df = pd.DataFrame(filtered_logs)
+        styled = logs_df.style.apply(
+            lambda row: [_LOG_LEVEL_STYLES.get(row["level"], "")] * len(row),
+            axis=1
+        )
+        st.dataframe(styled, use_container_width=True, hide_index=True)
+    else:
+        # If no logs match the filters
+        st.write("No logs match the selected filters.")
+
+@st.fragment
+def _render_alert_config():
+    """Alert configuration expander."""
+    with st.expander("Configure System Alerts"):
+        st.markdown("Set up alerts for system events and performance thresholds.")
+        
+        # Alert types
+        alert_types = st.multiselect(
+            "Select alert types to enable",
+            options=["High Error Rate", "High Response Time", "Low Model Accuracy", "System Downtime", "Unusual Transaction Volume"],
+            default=["High Error Rate", "System Downtime"]
+        )
+        
+        # Alert thresholds
+        if "High Error Rate" in alert_types:
+            st.slider("Error Rate Threshold (%)", min_value=0.01, max_value=5.0, value=1.0, step=0.01)
+        
+        if "High Response Time" in alert_types:
+            st.slider("Response Time Threshold (ms)", min_value=200, max_value=1000, value=500, step=10)
+        
+        if "Low Model Accuracy" in alert_types:
+            st.slider("Model Accuracy Threshold", min_value=0.8, max_value=0.99, value=0.9, step=0.01)
+        
+        if "Unusual Transaction Volume" in alert_types:
+            st.slider("Transaction Volume Change Threshold (%)", min_value=10, max_value=100, value=30, step=5)
+        
+        # Notification methods
+        st.multiselect(
+            "Notification Methods",
+            options=["Email", "SMS", "Slack", "PagerDuty", "Webhook"],
+            default=["Email", "Slack"]
+        )
+        
+        # Recipients
+        st.text_area("Notification Recipients", value="admin@example.com, oncall@example.com")
+        
+        # Save button
+        if st.button("Save Alert Configuration"):
+            st.success("Alert configuration saved successfully!")
+
+def _handle_switch(api_client, model_type, target_label, from_model):
+    """Switch the API's LLM service and report the outcome, tolerating a missing response."""
+    with st.spinner(f"Switching to {target_label}..."):
+        result = api_client.switch_llm_model(model_type)
+        if result and result.get("success"):
+            # Drop the cached LLM status so the switch shows up on the next rerun
+            _cached_llm_status.clear()
+            st.success(result.get("message", f"Successfully switched to {target_label}"))
+            st.session_state['model_switch_notification'] = {
+                'timestamp': datetime.datetime.now().isoformat(),
+                'message': f'Manually switched to {target_label}',
+                'from_model': from_model,
+                'to_model': target_label,
+                'displayed': False
+            }
+        elif result:
+            st.error(result.get("message", f"Failed to switch to {target_label}"))
+        else:
+            st.error(f"Failed to switch to {target_label}. API server may be unavailable.")
+
 def display_system_health():
     """Display system health metrics and monitoring information."""
     # Get API client
-    api_client = get_api_client()
+    api_client = _api_client()
     
     # System status
     st.markdown("### System Status")
@@ -25,33 +351,25 @@ def display_system_health():
         st.warning(f"⚠️ LLM Model Switch: {notification['message']} (From: {notification['from_model']} → To: {notification['to_model']})")
         st.session_state['model_switch_notification']['displayed'] = True
     
-    # Get health info to check LLM status
-    health_info = api_client.get_health()
-    llm_type = health_info.get('llm_service_type', 'unknown') if health_info else 'unknown'
-    llm_model = health_info.get('llm_model', 'N/A') if health_info else 'N/A'
+    # Get current LLM status (also drives the model switching controls below)
+    llm_status = _cached_llm_status()
+    llm_type = llm_status.get('llm_service_type', 'unknown') if llm_status else 'unknown'
+    llm_model = llm_status.get('llm_model', 'N/A') if llm_status else 'N/A'
     
     # Add a new row for LLM information
     st.markdown("#### Current LLM Service")
     cols_llm = st.columns(2)
+    llm_display = _LLM_DISPLAY.get(llm_type)
     with cols_llm[0]:
-        if llm_type == 'openai':
-            st.success(f"Using OpenAI API: {llm_model}")
-        elif llm_type == 'local':
-            st.info(f"Using Local LLM: {llm_model}")
-        elif llm_type in ['enhanced_mock', 'basic_mock']:
-            st.warning(f"Using Mock LLM: {llm_model}")
+        if llm_display:
+            st_func, label, _ = llm_display
+            st_func(f"{label}: {llm_model}")
         else:
             st.error("LLM Service: Unknown")
     
     with cols_llm[1]:
-        if llm_type == 'openai':
-            st.markdown("**Status:** Connected to OpenAI API")
-        elif llm_type == 'local':
-            st.markdown("**Status:** Using local model (no API costs)")
-        elif llm_type in ['enhanced_mock', 'basic_mock']:
-            st.markdown("**Status:** Using simulated responses (demonstration mode)")
-        else:
-            st.markdown("**Status:** Unknown LLM service state")
+        status_text = llm_display[2] if llm_display else "Unknown LLM service state"
+        st.markdown(f"**Status:** {status_text}")
     
     # Add separator
     st.markdown("---")
@@ -60,7 +378,7 @@ def display_system_health():
     cols = st.columns(3)
     
     # Try to get system metrics from API
-    metrics_data = api_client.get_metrics()
+    metrics_data = _cached_metrics()
     
     if metrics_data and "system" in metrics_data:
         # Use real metrics data
@@ -110,52 +428,23 @@ def display_system_health():
             max_value=datetime.date(2025, 5, 21)
         )
     
-    # Sample performance data
+    # One date index shared by all the sample data sections below
     dates = pd.date_range(start=start_date, end=end_date)
-    response_times = np.random.normal(250, 25, size=len(dates))
-    error_rates = np.random.beta(1, 100, size=len(dates)) * 100
-    request_counts = np.random.normal(5000, 500, size=len(dates)).astype(int)
-    
-    # Create DataFrame for metrics
-    metrics_df = pd.DataFrame({
-        'Date': dates,
-        'Response Time (ms)': response_times,
-        'Error Rate (%)': error_rates,
-        'Request Count': request_counts
-    })
+    
+    # Sample performance data
+    metrics_df = _perf_df(dates)
     
     # Tabs for different metrics
     tab1, tab2, tab3 = st.tabs(["Response Times", "Error Rates", "Request Volume"])
     
     with tab1:
-        fig = px.line(
-            metrics_df, 
-            x='Date', 
-            y='Response Time (ms)',
-            title='API Response Times'
-        )
-        fig.update_layout(xaxis_title="Date", yaxis_title="Response Time (ms)")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_line_fig(metrics_df, 'Response Time (ms)', 'API Response Times'), use_container_width=True)
     
     with tab2:
-        fig = px.line(
-            metrics_df, 
-            x='Date', 
-            y='Error Rate (%)',
-            title='API Error Rates'
-        )
-        fig.update_layout(xaxis_title="Date", yaxis_title="Error Rate (%)")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_line_fig(metrics_df, 'Error Rate (%)', 'API Error Rates'), use_container_width=True)
     
     with tab3:
-        fig = px.bar(
-            metrics_df, 
-            x='Date', 
-            y='Request Count',
-            title='Daily Request Volume'
-        )
-        fig.update_layout(xaxis_title="Date", yaxis_title="Request Count")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_bar_fig(metrics_df, 'Request Count', 'Daily Request Volume'), use_container_width=True)
     
     # Model performance
     st.markdown("### Model Performance")
@@ -167,64 +456,34 @@ def display_system_health():
         # Sample model metrics over time
         st.subheader("Model Metrics Over Time")
         
-        # Generate sample data for model metrics over time
-        dates = pd.date_range(start=start_date, end=end_date)
-        accuracy = 0.95 + np.random.normal(0, 0.01, size=len(dates))
-        precision = 0.92 + np.random.normal(0, 0.02, size=len(dates))
-        recall = 0.89 + np.random.normal(0, 0.02, size=len(dates))
-        f1 = 0.91 + np.random.normal(0, 0.015, size=len(dates))
-        
-        # Create dataframe for metrics
-        model_metrics_df = pd.DataFrame({
-            'Date': dates,
-            'Accuracy': accuracy,
-            'Precision': precision,
-            'Recall': recall,
-            'F1 Score': f1
-        })
+        # Sample data for model metrics over time
+        model_metrics_df = _model_metrics_df(dates)
         
-        # Select which metrics to display
-        selected_metrics = st.multiselect(
-            "Select metrics to display",
-            options=['Accuracy', 'Precision', 'Recall', 'F1 Score'],
-            default=['Accuracy', 'F1 Score']
-        )
-        
-        if selected_metrics:
-            fig = px.line(
-                model_metrics_df, 
-                x='Date', 
-                y=selected_metrics,
-                title='Model Performance Metrics Over Time'
-            )
-            fig.update_layout(xaxis_title="Date", yaxis_title="Score", yaxis=dict(range=[0.85, 1.0]))
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Please select at least one metric to display.")
+        _render_model_metrics(model_metrics_df)
     
     with col2:        # Current model comparison
         st.subheader("Current Model Comparison")
         
-        # Get model metrics from API
+        # Reuse the metrics fetched for the system status section above
         with st.spinner("Loading model metrics from API..."):
-            metrics_data = api_client.get_metrics()
-            
             if metrics_data and "models" in metrics_data:
                 # We have real metrics data from the API
                 
-                # Extract model metrics into a DataFrame
+                # Extract model metrics into a long frame and pivot to one column per model
                 models = metrics_data["models"]
-                model_metrics_data = []
-                
-                for metric_name in ["accuracy", "precision", "recall", "f1_score", "auc"]:
-                    row = {"Metric": metric_name.replace("_", " ").title()}
-                    
-                    for model in models:
-                        row[model["name"]] = model["metrics"][metric_name]
-                        
-                    model_metrics_data.append(row)
-                    
-                model_metrics = pd.DataFrame(model_metrics_data)
+                model_names = list(dict.fromkeys(model["name"] for model in models))
+                long_metrics = pd.DataFrame(
+                    [(model["name"], metric_name, model["metrics"][metric_name])
+                     for model in models for metric_name in _MODEL_METRIC_NAMES],
+                    columns=["Model", "Metric", "Value"]
+                ).drop_duplicates(["Model", "Metric"], keep="last")
+                model_metrics = (
+                    long_metrics.pivot(index="Metric", columns="Model", values="Value")
+                    .reindex(index=list(_MODEL_METRIC_NAMES), columns=model_names)
+                    .reset_index()
+                )
+                model_metrics.columns.name = None
+                model_metrics["Metric"] = model_metrics["Metric"].str.replace("_", " ").str.title()
                 
                 st.success("Displaying real model metrics data from your models")
             else:
@@ -232,55 +491,16 @@ def display_system_health():
                 st.warning("Couldn't load real metrics data from API. Showing sample data.")
                 
                 # Sample model metrics for comparison
-                model_metrics = pd.DataFrame({
-                    "Metric": ["Accuracy", "Precision", "Recall", "F1 Score", "AUC"],
-                    "ML Model": [0.952, 0.923, 0.897, 0.910, 0.964],
-                    "LLM+RAG": [0.968, 0.942, 0.921, 0.931, 0.978],
-                    "Combined": [0.975, 0.958, 0.943, 0.950, 0.986]
-                })
+                model_metrics = _fallback_model_metrics()
             
             # Create the comparison chart
-            fig = go.Figure()
-            
-            for column in model_metrics.columns[1:]:
-                fig.add_trace(go.Bar(
-                    x=model_metrics["Metric"],
-                    y=model_metrics[column],
-                    name=column
-                ))
-            
-            fig.update_layout(
-                title="Model Performance Comparison",
-                xaxis_title="Metric",
-                yaxis_title="Score",
-                yaxis=dict(range=[0.85, 1.0]),
-                barmode='group'
-            )
-            
-            # Add last updated time if available
-            if metrics_data and "timestamp" in metrics_data:
-                update_time = datetime.datetime.fromisoformat(metrics_data["timestamp"].replace("Z", "+00:00"))
-                fig.update_layout(
-                    annotations=[
-                        dict(
-                            text=f"Last updated: {update_time.strftime('%Y-%m-%d %H:%M:%S')}",
-                            showarrow=False,
-                            x=0.5,
-                            y=-0.15,
-                            xref="paper",
-                            yref="paper"
-                        )
-                    ]
-                )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            timestamp = metrics_data.get("timestamp") if metrics_data else None
+            st.plotly_chart(_model_comparison_fig(model_metrics, timestamp), use_container_width=True)
     
     # After the current model metrics section, add model switching controls
     st.markdown("### LLM Model Controls")
     
-    # Get current LLM status
-    llm_status = api_client.get_llm_status()
-    current_model_type = llm_status.get("llm_service_type", "unknown") if llm_status else "unknown"
+    current_model_type = llm_type
     
     # Create model switching form
     with st.form("switch_model_form"):
@@ -301,199 +521,44 @@ def display_system_health():
                 
         with col3:
             mock_button = st.form_submit_button("Use Mock LLM", 
-                type="primary" if current_model_type in ["enhanced_mock", "basic_mock"] else "secondary",
-                disabled=current_model_type in ["enhanced_mock", "basic_mock"])
+                type="primary" if current_model_type in _MOCK_TYPES else "secondary",
+                disabled=current_model_type in _MOCK_TYPES)
                 
         # Handle button clicks
         if openai_button:
-            with st.spinner("Switching to OpenAI API..."):
-                result = api_client.switch_llm_model("openai")
-                if result and result.get("success"):
-                    st.success(result.get("message", "Successfully switched to OpenAI API"))
-                    st.session_state['model_switch_notification'] = {
-                        'timestamp': datetime.datetime.now().isoformat(),
-                        'message': 'Manually switched to OpenAI API',
-                        'from_model': current_model_type,
-                        'to_model': 'OpenAI API',
-                        'displayed': False
-                    }
-                elif result:
-                    st.error(result.get("message", "Failed to switch to OpenAI API"))
-                else:
-                    st.error("Failed to switch to OpenAI API. API server may be unavailable.")
-                    
+            _handle_switch(api_client, "openai", "OpenAI API", current_model_type)
         elif local_button:
-            with st.spinner("Switching to Local LLM..."):
-                result = api_client.switch_llm_model("local")
-                if result and result.get("success"):
-                    st.success(result.get("message", "Successfully switched to Local LLM"))
-                    st.session_state['model_switch_notification'] = {
-                        'timestamp': datetime.datetime.now().isoformat(),
-                        'message': 'Manually switched to Local LLM',
-                        'from_model': current_model_type,
-                        'to_model': 'Local LLM',
-                        'displayed': False
-                    }
-                elif result:
-                    st.error(result.get("message", "Failed to switch to Local LLM"))
-                else:
-                    st.error("Failed to switch to Local LLM. API server may be unavailable.")
-                    
+            _handle_switch(api_client, "local", "Local LLM", current_model_type)
         elif mock_button:
-            with st.spinner("Switching to Mock LLM..."):
-                result = api_client.switch_llm_model("mock")
-                if result and result.get("success"):
-                    st.success(result.get("message", "Successfully switched to Mock LLM"))
-                    st.session_state['model_switch_notification'] = {
-                        'timestamp': datetime.datetime.now().isoformat(),
-                        'message': 'Manually switched to Mock LLM',
-                        'from_model': current_model_type,
-                        'to_model': 'Mock LLM',
-                        'displayed': False
-                    }
-                elif result:
-                    st.error(result.get("message", "Failed to switch to Mock LLM"))
-                else:
-                    st.error("Failed to switch to Mock LLM. API server may be unavailable.")
+            _handle_switch(api_client, "mock", "Mock LLM", current_model_type)
     
     # Resource utilization
     st.markdown("### Resource Utilization")
     
     # Sample resource utilization data
-    dates = pd.date_range(start=start_date, end=end_date)
-    cpu_usage = np.random.normal(40, 15, size=len(dates))
-    memory_usage = np.random.normal(60, 10, size=len(dates))
-    disk_io = np.random.normal(30, 12, size=len(dates))
-    
-    # Create DataFrame for resource metrics
-    resource_df = pd.DataFrame({
-        'Date': dates,
-        'CPU Usage (%)': cpu_usage,
-        'Memory Usage (%)': memory_usage,
-        'Disk I/O (%)': disk_io
-    })
+    resource_df = _resource_df(dates)
     
     # Tabs for different resources
     tab1, tab2, tab3 = st.tabs(["CPU Usage", "Memory Usage", "Disk I/O"])
     
     with tab1:
-        fig = px.line(
-            resource_df, 
-            x='Date', 
-            y='CPU Usage (%)',
-            title='CPU Usage Over Time'
-        )
-        fig.update_layout(xaxis_title="Date", yaxis_title="CPU Usage (%)")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_line_fig(resource_df, 'CPU Usage (%)', 'CPU Usage Over Time'), use_container_width=True)
     
     with tab2:
-        fig = px.line(
-            resource_df, 
-            x='Date', 
-            y='Memory Usage (%)',
-            title='Memory Usage Over Time'
-        )
-        fig.update_layout(xaxis_title="Date", yaxis_title="Memory Usage (%)")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_line_fig(resource_df, 'Memory Usage (%)', 'Memory Usage Over Time'), use_container_width=True)
     
     with tab3:
-        fig = px.line(
-            resource_df, 
-            x='Date', 
-            y='Disk I/O (%)',
-            title='Disk I/O Over Time'
-        )
-        fig.update_layout(xaxis_title="Date", yaxis_title="Disk I/O (%)")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_line_fig(resource_df, 'Disk I/O (%)', 'Disk I/O Over Time'), use_container_width=True)
     
     # System logs
     st.markdown("### System Logs")
     
-    # Log level selector
-    log_level = st.selectbox("Log Level", ["INFO", "WARNING", "ERROR", "DEBUG"])
-    
-    # Log type selector
-    log_type = st.selectbox("Log Type", ["All", "API", "Model", "Database", "Security"])
-    
-    # Sample logs
-    logs = [
-        {"timestamp": "2025-05-21 10:15:23", "level": "INFO", "type": "API", "message": "Transaction tx_1000 processed successfully"},
-        {"timestamp": "2025-05-21 10:14:12", "level": "INFO", "type": "API", "message": "Transaction tx_999 processed successfully"},
-        {"timestamp": "2025-05-21 10:12:45", "level": "WARNING", "type": "API", "message": "High response time detected for transaction tx_998"},
-        {"timestamp": "2025-05-21 10:10:33", "level": "INFO", "type": "Model", "message": "Model prediction completed for transaction tx_997"},
-        {"timestamp": "2025-05-21 10:08:21", "level": "ERROR", "type": "Database", "message": "Failed to process transaction tx_996: Database connection timeout"},
-        {"timestamp": "2025-05-21 10:05:17", "level": "INFO", "type": "API", "message": "Transaction tx_995 processed successfully"},
-        {"timestamp": "2025-05-21 10:03:42", "level": "DEBUG", "type": "Model", "message": "Vector similarity calculation took 123ms for transaction tx_994"},
-        {"timestamp": "2025-05-21 10:01:19", "level": "INFO", "type": "Security", "message": "Suspicious IP address detected for transaction tx_993"},
-    ]
-    
-    # Filter logs by selected level and type
-    filtered_logs = logs
-    
-    # Filter by log level
-    if log_level != "DEBUG":
-        filtered_logs = [log for log in filtered_logs if log["level"] == log_level or 
-                        (log_level == "WARNING" and log["level"] == "ERROR") or
-                        (log_level == "ERROR" and log["level"] != "WARNING" and log["level"] != "INFO" and log["level"] != "DEBUG")]
-    
-    # Filter by log type
-    if log_type != "All":
-        filtered_logs = [log for log in filtered_logs if log["type"] == log_type]
-    
-    # Display logs with appropriate styling
-    for log in filtered_logs:
-        if log["level"] == "ERROR":
-            st.error(f"{log['timestamp']} - {log['type']} - {log['message']}")
-        elif log["level"] == "WARNING":
-            st.warning(f"{log['timestamp']} - {log['type']} - {log['message']}")
-        elif log["level"] == "INFO":
-            st.info(f"{log['timestamp']} - {log['type']} - {log['message']}")
-        else:
-            st.text(f"{log['timestamp']} - {log['type']} - {log['level']} - {log['message']}")
-    
-    # If no logs match the filters
-    if not filtered_logs:
-        st.write("No logs match the selected filters.")
+    _render_logs(_SAMPLE_LOGS)
     
     # Alert configuration
     st.markdown("### Alert Configuration")
     
-    with st.expander("Configure System Alerts"):
-        st.markdown("Set up alerts for system events and performance thresholds.")
-        
-        # Alert types
-        alert_types = st.multiselect(
-            "Select alert types to enable",
-            options=["High Error Rate", "High Response Time", "Low Model Accuracy", "System Downtime", "Unusual Transaction Volume"],
-            default=["High Error Rate", "System Downtime"]
-        )
-        
-        # Alert thresholds
-        if "High Error Rate" in alert_types:
-            st.slider("Error Rate Threshold (%)", min_value=0.01, max_value=5.0, value=1.0, step=0.01)
-        
-        if "High Response Time" in alert_types:
-            st.slider("Response Time Threshold (ms)", min_value=200, max_value=1000, value=500, step=10)
-        
-        if "Low Model Accuracy" in alert_types:
-            st.slider("Model Accuracy Threshold", min_value=0.8, max_value=0.99, value=0.9, step=0.01)
-        
-        if "Unusual Transaction Volume" in alert_types:
-            st.slider("Transaction Volume Change Threshold (%)", min_value=10, max_value=100, value=30, step=5)
-        
-        # Notification methods
-        st.multiselect(
-            "Notification Methods",
-            options=["Email", "SMS", "Slack", "PagerDuty", "Webhook"],
-            default=["Email", "Slack"]
-        )
-        
-        # Recipients
-        st.text_area("Notification Recipients", value="admin@example.com, oncall@example.com")
-        
-        # Save button
-        if st.button("Save Alert Configuration"):
-            st.success("Alert configuration saved successfully!")
+    _render_alert_config()
 
 if __name__ == "__main__":
     st.set_page_config(
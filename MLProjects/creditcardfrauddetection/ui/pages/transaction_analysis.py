@@ -3,60 +3,65 @@ Transaction Analysis page for the Credit Card Fraud Detection System.
 """
 
 import streamlit as st
-import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 import datetime
 import time
-import json
+import threading
 from api_client import get_api_client
+from sample_transactions import N_FLOATS, N_INTS, build_transaction
 
-def generate_sample_transaction(is_fraudulent=False):
+@st.cache_resource(show_spinner=False)
+def _api_client():
+    """API client shared across reruns so its HTTP connection pool is reused."""
+    return get_api_client()
+
+# Cached per (is_fraudulent, seed) so the same sample survives reruns until a new seed is requested
+@st.cache_data(max_entries=32, show_spinner=False)
+def _sample_payload(is_fraudulent=False, seed=0):
+    """Random fields of a sample transaction for the given seed."""
+    # Draw every random field up front in two vectorized calls
+    rng = np.random.default_rng(seed)
+    ints = rng.integers(0, 10**7, size=N_INTS)
+    floats = rng.random(size=N_FLOATS)
+    return build_transaction(ints, floats, is_fraudulent)
+
+def generate_sample_transaction(is_fraudulent=False, seed=0):
     """Generate a sample transaction for demonstration."""
-    # Common transaction properties
-    transaction = {
+    # The cached payload is shared by every session, so each call gets its own ID and timestamp
+    return {
         "transaction_id": f"tx_{int(time.time())}",
-        "card_id": f"card_{np.random.randint(1000000, 9999999)}",
-        "customer_id": f"cust_{np.random.randint(10000, 99999)}",
         "timestamp": datetime.datetime.now().isoformat(),
-        "currency": "USD",
+        **_sample_payload(is_fraudulent, seed),
     }
-    
-    if is_fraudulent:
-        # Fraudulent transaction patterns
-        merchant_categories = ["Electronics", "Digital Goods", "Jewelry", "Travel"]
-        transaction.update({
-            "merchant_id": f"merch_{np.random.randint(10000, 99999)}",
-            "merchant_name": np.random.choice(["TechGiant", "LuxuryItems", "QuickBuy", "DigitalMart"]),
-            "merchant_category": np.random.choice(merchant_categories),
-            "merchant_country": np.random.choice(["RU", "NG", "CN", "VE"]),  # Unusual countries
-            "merchant_zip": f"{np.random.randint(10000, 99999)}",
-            "amount": np.random.uniform(800, 5000),  # Higher amount
-            "is_online": True,
-            "device_id": f"dev_{np.random.randint(1000000, 9999999)}",  # New device
-            "ip_address": f"192.168.{np.random.randint(0, 255)}.{np.random.randint(0, 255)}",
-            "latitude": np.random.uniform(30, 60),
-            "longitude": np.random.uniform(-120, 30),
-        })
-    else:
-        # Legitimate transaction patterns
-        merchant_categories = ["Groceries", "Restaurant", "Retail", "Gas Station"]
-        transaction.update({
-            "merchant_id": f"merch_{np.random.randint(10000, 99999)}",
-            "merchant_name": np.random.choice(["LocalGrocery", "CityDiner", "HomeShopping", "GasStop"]),
-            "merchant_category": np.random.choice(merchant_categories),
-            "merchant_country": "US",  # Home country
-            "merchant_zip": f"{np.random.randint(10000, 99999)}",
-            "amount": np.random.uniform(10, 200),  # Lower amount
-            "is_online": np.random.choice([True, False]),
-            "device_id": "dev_regular123",  # Regular device
-            "ip_address": f"192.168.1.{np.random.randint(1, 100)}",
-            "latitude": 40.7128,  # New York coordinates
-            "longitude": -74.0060,
-        })
-    
-    return transaction
+
+# The gauge figure is shared across sessions, so updating and rendering it is serialized
+_gauge_lock = threading.Lock()
+
+@st.cache_resource(show_spinner=False)
+def _gauge_template():
+    """Confidence gauge built once; callers set the value and bar colour before rendering."""
+    # Plotly is imported on first use so it stays off the page's cold-start path
+    import plotly.graph_objects as go
+    return go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = 0,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Fraud Confidence Score"},
+        gauge = {
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "darkgreen"},
+            'steps': [
+                {'range': [0, 30], 'color': "lightgreen"},
+                {'range': [30, 70], 'color': "lightyellow"},
+                {'range': [70, 100], 'color': "salmon"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 85
+            }
+        }
+    ))
 
 def display_transaction_result(result):
     """Display the result of a fraud detection transaction."""
@@ -79,54 +84,46 @@ def display_transaction_result(result):
     # Create two columns
     col1, col2 = st.columns(2)
     
+    # One markdown block per section keeps this to a single frontend delta each
     with col1:
-        st.markdown("#### Transaction Details")
-        st.markdown(f"**Transaction ID:** {result['transaction_id']}")
-        st.markdown(f"**Amount:** ${result.get('amount', 'N/A')}")
-        st.markdown(f"**Merchant:** {result.get('merchant_name', 'N/A')}")
-        st.markdown(f"**Category:** {result.get('merchant_category', 'N/A')}")
-        st.markdown(f"**Time:** {result.get('timestamp', 'N/A')}")
+        st.markdown(
+            "#### Transaction Details\n\n"
+            f"**Transaction ID:** {result['transaction_id']}\n\n"
+            f"**Amount:** ${result.get('amount', 'N/A')}\n\n"
+            f"**Merchant:** {result.get('merchant_name', 'N/A')}\n\n"
+            f"**Category:** {result.get('merchant_category', 'N/A')}\n\n"
+            f"**Time:** {result.get('timestamp', 'N/A')}"
+        )
     
     with col2:
-        st.markdown("#### Analysis Details")
-        st.markdown(f"**Confidence Score:** {result['confidence_score']*100:.2f}%")
-        st.markdown(f"**Processing Time:** {result['processing_time_ms']} ms")
-        st.markdown(f"**Manual Review:** {'Yes' if result['requires_review'] else 'No'}")
+        st.markdown(
+            "#### Analysis Details\n\n"
+            f"**Confidence Score:** {result['confidence_score']*100:.2f}%\n\n"
+            f"**Processing Time:** {result['processing_time_ms']} ms\n\n"
+            f"**Manual Review:** {'Yes' if result['requires_review'] else 'No'}"
+        )
     
     # Decision reasoning
-    st.markdown("#### Decision Reasoning")
-    st.markdown(f"{result['decision_reason']}")
+    st.markdown(f"#### Decision Reasoning\n\n{result['decision_reason']}")
     
-    # Visualization of confidence score
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number",
-        value = result['confidence_score']*100,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': "Fraud Confidence Score"},
-        gauge = {
-            'axis': {'range': [0, 100]},
-            'bar': {'color': "darkred" if result['is_fraud'] else "darkgreen"},
-            'steps': [
-                {'range': [0, 30], 'color': "lightgreen"},
-                {'range': [30, 70], 'color': "lightyellow"},
-                {'range': [70, 100], 'color': "salmon"}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': 85
-            }
-        }
-    ))
-    st.plotly_chart(fig, use_container_width=True)
+    # Visualization of confidence score: only the value and bar colour change per result
+    with _gauge_lock:
+        fig = _gauge_template()
+        fig.update_traces(
+            value=result['confidence_score']*100,
+            gauge_bar_color="darkred" if result['is_fraud'] else "darkgreen"
+        )
+        st.plotly_chart(fig, use_container_width=True)
 
+# Runs as a fragment so submitting feedback reruns only the form, not the whole page
+@st.fragment
 def display_feedback_form(transaction_id):
     """Display a form for submitting feedback on fraud detection results."""
     st.markdown("## Analyst Feedback")
     st.markdown("Submit your assessment of this transaction for model improvement.")
     
     # Get API client
-    api_client = get_api_client()
+    api_client = _api_client()
     
     with st.form(key="feedback_form"):
         actual_fraud = st.radio(
@@ -170,16 +167,23 @@ def real_time_analysis():
             ["Generate Legitimate Transaction", "Generate Suspicious Transaction", "Custom Transaction"]
         )
     
+    # Draw a new sample only when the transaction type selection changes; each session starts
+    # from its own random seed so users do not all see the same samples
+    seed = st.session_state.setdefault("sample_seed", int(np.random.default_rng().integers(2**31)))
+    if st.session_state.get("sample_test_type") != test_type:
+        st.session_state.sample_test_type = test_type
+        seed = st.session_state.sample_seed = seed + 1
+    
     # Initialize transaction data
     transaction_data = {}
     
     if test_type == "Generate Legitimate Transaction":
-        transaction_data = generate_sample_transaction(is_fraudulent=False)
+        transaction_data = generate_sample_transaction(is_fraudulent=False, seed=seed)
     elif test_type == "Generate Suspicious Transaction":
-        transaction_data = generate_sample_transaction(is_fraudulent=True)
+        transaction_data = generate_sample_transaction(is_fraudulent=True, seed=seed)
     
     # Get API client
-    api_client = get_api_client()
+    api_client = _api_client()
     
     # Transaction form
     with st.form(key="transaction_form"):
@@ -308,26 +312,32 @@ def real_time_analysis():
                 # Display the result
                 st.success("✅ **Analysis Complete!**")
                 display_transaction_result(result)
+                # Remember the analyzed transaction so its feedback form survives later reruns;
+                # only written when it changes, and read below in this same run
+                if st.session_state.get("transaction_for_feedback") != transaction_id:
+                    st.session_state.transaction_for_feedback = transaction_id
             else:
                 st.error("❌ Failed to analyze transaction. The API may be overloaded or the LLM service is unavailable. Please try again.")
-                      # Store the transaction ID in session state to use it outside the form
-            if submit_button and result:
-                st.session_state.transaction_for_feedback = transaction_id
 
-    # Display feedback form outside of any form
-    if 'transaction_for_feedback' in st.session_state:
-        display_feedback_form(st.session_state.transaction_for_feedback)
-        # Optional: Remove from session state after displaying
-        # Uncomment the following line if you want the form to appear only once
-        # del st.session_state.transaction_for_feedback
+    # Display feedback form outside of any form (forms cannot be nested)
+    feedback_transaction_id = st.session_state.get("transaction_for_feedback")
+    if feedback_transaction_id:
+        display_feedback_form(feedback_transaction_id)
+
+# Successful lookups are cached per transaction ID; a failed lookup raises so it is never cached
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _lookup_transaction(transaction_id):
+    """Fetch a past transaction's analysis result from the API."""
+    result = _api_client().get_transaction_history(transaction_id)
+    if not result:
+        raise LookupError(transaction_id)
+    return result
 
 def historical_lookup():
     """Show the historical transaction lookup tab."""
     st.markdown("### Historical Transaction Lookup")
     
-    # Get API client
-    api_client = get_api_client()
-      # Instructions for transaction lookup
+    # Instructions for transaction lookup
     st.markdown("""
     Enter a transaction ID to look up its details and analysis results.
     Transaction IDs can be found in the dashboard or from previous analyses.
@@ -338,7 +348,10 @@ def historical_lookup():
         if transaction_id:            
             with st.spinner("Looking up transaction..."):
                 # Call the API for transaction history
-                result = api_client.get_transaction_history(transaction_id)
+                try:
+                    result = _lookup_transaction(transaction_id)
+                except LookupError:
+                    result = None
                 
                 if result:
                     display_transaction_result(result)
@@ -0,0 +1,60 @@
+"""
+Sample transaction builder for the Streamlit UI.
+"""
+
+# Raw draws per sample: 10 integers for ids/choices and 3 floats for amount and location
+N_INTS = 10
+N_FLOATS = 3
+
+def _pick(options, draw):
+    """Map a raw integer draw onto one of the options."""
+    return options[int(draw) % len(options)]
+
+def _in_range(draw, low, high):
+    """Map a raw integer draw into [low, high)."""
+    return low + int(draw) % (high - low)
+
+def build_transaction(ints, floats, is_fraudulent=False):
+    """Build a sample transaction dict from one row of raw integer and float draws.
+
+    The transaction_id and timestamp are per request, so callers add them.
+    """
+    # Common transaction properties
+    transaction = {
+        "card_id": f"card_{_in_range(ints[0], 1000000, 9999999)}",
+        "customer_id": f"cust_{_in_range(ints[1], 10000, 99999)}",
+        "merchant_id": f"merch_{_in_range(ints[2], 10000, 99999)}",
+        "merchant_zip": f"{_in_range(ints[3], 10000, 99999)}",
+        "currency": "USD",
+    }
+
+    if is_fraudulent:
+        # Fraudulent transaction patterns
+        merchant_categories = ["Electronics", "Digital Goods", "Jewelry", "Travel"]
+        transaction.update({
+            "merchant_name": _pick(["TechGiant", "LuxuryItems", "QuickBuy", "DigitalMart"], ints[4]),
+            "merchant_category": _pick(merchant_categories, ints[5]),
+            "merchant_country": _pick(["RU", "NG", "CN", "VE"], ints[6]),  # Unusual countries
+            "amount": 800 + float(floats[0]) * (5000 - 800),  # Higher amount
+            "is_online": True,
+            "device_id": f"dev_{_in_range(ints[7], 1000000, 9999999)}",  # New device
+            "ip_address": f"192.168.{_in_range(ints[8], 0, 255)}.{_in_range(ints[9], 0, 255)}",
+            "latitude": 30 + float(floats[1]) * (60 - 30),
+            "longitude": -120 + float(floats[2]) * (30 - -120),
+        })
+    else:
+        # Legitimate transaction patterns
+        merchant_categories = ["Groceries", "Restaurant", "Retail", "Gas Station"]
+        transaction.update({
+            "merchant_name": _pick(["LocalGrocery", "CityDiner", "HomeShopping", "GasStop"], ints[4]),
+            "merchant_category": _pick(merchant_categories, ints[5]),
+            "merchant_country": "US",  # Home country
+            "amount": 10 + float(floats[0]) * (200 - 10),  # Lower amount
+            "is_online": _pick([True, False], ints[6]),
+            "device_id": "dev_regular123",  # Regular device
+            "ip_address": f"192.168.1.{_in_range(ints[7], 1, 100)}",
+            "latitude": 40.7128,  # New York coordinates
+            "longitude": -74.0060,
+        })
+
+    return transaction
@@ -4,12 +4,17 @@ Test script to verify UI functionality for fraud patterns.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 API_URL = "http://localhost:8000"
 STREAMLIT_URL = "http://localhost:8501"
 API_KEY = "development_api_key_for_testing"
 
+# One keep-alive session shared by all probes so repeat calls reuse connections
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 def test_api_connectivity():
     """Test API connectivity and fraud patterns endpoint."""
     print("🧪 Testing API Connectivity and Fraud Patterns")
@@ -22,7 +27,7 @@ def test_api_connectivity():
     
     # Test health endpoint
     try:
-        response = requests.get(f"{API_URL}/api/v1/health", headers=headers, timeout=5)
+        response = session.get(f"{API_URL}/api/v1/health", headers=headers, timeout=5)
         if response.status_code == 200:
             print("✅ API Health Check: PASSED")
             health_data = response.json()
@@ -37,7 +42,7 @@ def test_api_connectivity():
     
     # Test fraud patterns endpoint
     try:
-        response = requests.get(f"{API_URL}/api/v1/fraud-patterns", headers=headers, timeout=10)
+        response = session.get(f"{API_URL}/api/v1/fraud-patterns", headers=headers, timeout=10)
         if response.status_code == 200:
             patterns = response.json()
             print(f"✅ Fraud Patterns API: PASSED")
@@ -46,16 +51,17 @@ def test_api_connectivity():
             if patterns:
                 # Show details of first pattern
                 first_pattern = patterns[0]
+                pat0 = first_pattern.get('pattern', {})
                 print(f"   Sample pattern ID: {first_pattern.get('id', 'Unknown')}")
                 print(f"   Sample pattern name: {first_pattern.get('name', 'Unknown')}")
-                print(f"   Sample fraud type: {first_pattern.get('pattern', {}).get('fraud_type', 'Unknown')}")
+                print(f"   Sample fraud type: {pat0.get('fraud_type', 'Unknown')}")
                 
                 # Count fraud types
-                fraud_types = set()
-                for pattern in patterns:
-                    fraud_type = pattern.get('pattern', {}).get('fraud_type', 'Unknown')
-                    if fraud_type:
-                        fraud_types.add(fraud_type)
+                fraud_types = {
+                    fraud_type
+                    for fraud_type in (p.get('pattern', {}).get('fraud_type', 'Unknown') for p in patterns)
+                    if fraud_type
+                }
                 
                 print(f"   Unique fraud types: {len(fraud_types)}")
                 print(f"   Fraud types: {', '.join(sorted(fraud_types)[:5])}{'...' if len(fraud_types) > 5 else ''}")
@@ -74,7 +80,7 @@ def test_streamlit_accessibility():
     print("=" * 50)
     
     try:
-        response = requests.get(STREAMLIT_URL, timeout=5)
+        response = session.get(STREAMLIT_URL, timeout=5)
         if response.status_code == 200:
             print("✅ Streamlit UI: ACCESSIBLE")
             print(f"   URL: {STREAMLIT_URL}")
@@ -6,23 +6,70 @@ A client to interact with the MCP stock server running in Docker
 
 import subprocess
 import json
+import queue
 import sys
+import threading
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+# Talk to the Docker daemon in-process when the SDK is installed, otherwise shell out to the CLI
+try:
+    import docker
+    USING_DOCKER_SDK = True
+except ImportError:
+    USING_DOCKER_SDK = False
+
+# How long a container status check is reused before asking Docker again
+STATUS_CACHE_SECONDS = 2.0
+
+# Upper bound on how long a batch of tool calls may wait for the server's replies
+REQUEST_TIMEOUT_SECONDS = 30.0
 
 class DockerMCPClient:
     def __init__(self, container_name: str = "mcp-stock-server"):
         self.container_name = container_name
+        # One long-lived `docker exec` MCP session, started lazily and reused per query
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: Optional[queue.Queue] = None
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._status_checked_at = float("-inf")
+        self._status_running = False
+        self._docker = None
+        if USING_DOCKER_SDK:
+            try:
+                self._docker = docker.from_env()
+            except Exception:
+                self._docker = None
 
     def is_container_running(self) -> bool:
-        """Check if the MCP stock server container is running"""
+        """Check if the MCP stock server container is running (cached for a couple of seconds)"""
+        now = time.monotonic()
+        if now - self._status_checked_at < STATUS_CACHE_SECONDS:
+            return self._status_running
+
+        self._status_running = self._check_container_running()
+        self._status_checked_at = now
+        return self._status_running
+
+    def _check_container_running(self) -> bool:
+        """Ask Docker whether the container is running"""
+        if self._docker is not None:
+            try:
+                return self._docker.containers.get(self.container_name).status == "running"
+            except docker.errors.NotFound:
+                return False
+            except Exception:
+                pass  # daemon unreachable through the SDK; fall back to the CLI
+
         try:
             result = subprocess.run([
                 "docker", "ps", "--filter", f"name={self.container_name}", 
                 "--format", "{{.Status}}"
-            ], capture_output=True, text=True, timeout=10)
+            ], capture_output=True, timeout=10)
             
-            return "Up" in result.stdout
+            # Output is only scanned for a fixed marker, so it is never decoded
+            return b"Up" in result.stdout
         except:
             return False
 
@@ -36,92 +83,180 @@ class DockerMCPClient:
             print(f"🚀 Starting container {self.container_name}...")
             result = subprocess.run([
                 "docker-compose", "up", "-d"
-            ], capture_output=True, text=True, cwd=".")
+            ], capture_output=True, cwd=".")
             
             if result.returncode == 0:
+                self._status_checked_at = float("-inf")
                 print(f"✅ Container {self.container_name} started successfully")
                 time.sleep(2)  # Give container time to start
                 return True
             else:
-                print(f"❌ Failed to start container: {result.stderr}")
+                print(f"❌ Failed to start container: {result.stderr.decode(errors='replace')}")
                 return False
         except Exception as e:
             print(f"❌ Error starting container: {e}")
             return False
 
-    def query_stock_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Query a stock tool in the MCP server running in Docker"""
+    def _ensure_proc(self) -> subprocess.Popen:
+        """Start the MCP server session in the container and run the initialize handshake once"""
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+
+        cmd = [
+            "docker", "exec", "-i", self.container_name,
+            "python", "/app/mcp_stock_server.py"
+        ]
+
+        # stderr is discarded: nothing drains it for a long-lived process, so a pipe would fill up
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        # A daemon thread does the blocking reads, so waits can time out on every platform
+        # (select() cannot wait on pipes on Windows)
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump_stdout, args=(self._proc.stdout, self._lines), daemon=True
+        ).start()
+
+        init_request = {
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {"tools": {}},
+                "clientInfo": {"name": "docker-client", "version": "1.0.0"}
+            }
+        }
+
+        self._proc.stdin.write(json.dumps(init_request).encode() + b"\n")
+        self._proc.stdin.flush()
+        if 0 not in self._read_responses({0}, time.monotonic() + REQUEST_TIMEOUT_SECONDS):
+            raise RuntimeError("MCP server closed the connection during initialize")
+        self._proc.stdin.write(b'{"jsonrpc": "2.0", "method": "notifications/initialized"}\n')
+        self._proc.stdin.flush()
+        return self._proc
+
+    @staticmethod
+    def _pump_stdout(stdout, lines: queue.Queue) -> None:
+        """Forward stdout lines to the queue; None marks EOF"""
+        for line in iter(stdout.readline, b""):
+            lines.put(line.rstrip(b"\n"))
+        lines.put(None)
+
+    def _read_line(self, deadline: float) -> Optional[bytes]:
+        """Next stdout line; None on EOF, TimeoutError past the deadline"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("timed out waiting for the MCP server")
+        try:
+            return self._lines.get(timeout=remaining)
+        except queue.Empty:
+            raise TimeoutError("timed out waiting for the MCP server") from None
+
+    def _read_responses(self, request_ids, deadline: float) -> Dict[int, bytes]:
+        """Read until every request id has its reply, skipping logs, notifications and stray lines"""
+        pending = set(request_ids)
+        replies = {}
+        while pending:
+            line = self._read_line(deadline)
+            if line is None:
+                self.close()
+                break
+            try:
+                response_id = json.loads(line).get("id")
+            except (json.JSONDecodeError, AttributeError):
+                continue
+            if response_id in pending:
+                pending.discard(response_id)
+                replies[response_id] = line
+        return replies
+
+    def close(self, kill: bool = False) -> None:
+        """Terminate the MCP server session if one is running (kill=True skips the graceful wait)"""
+        proc, self._proc = self._proc, None
+        self._lines = None
+        if proc is None:
+            return
+        if not kill:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=5)
+                return
+            except Exception:
+                pass
+        proc.kill()
+
+    def __del__(self):
+        self.close()
+
+    @staticmethod
+    def _tool_result(line: bytes) -> Dict[str, Any]:
+        """Extract the tool payload from a tools/call response line"""
+        try:
+            response = json.loads(line)
+            if "result" in response and "content" in response["result"]:
+                content = response["result"]["content"][0]["text"]
+                return json.loads(content)
+        except json.JSONDecodeError:
+            pass
+
+        return {"raw_output": line.decode(errors="replace")}
+
+    def query_stock_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Send several tool calls at once and collect the replies in call order.
+
+        All requests are written before any reply is read, so the server can work on
+        them concurrently instead of one stdio round-trip at a time.
+        """
         if not self.is_container_running():
             print(f"❌ Container {self.container_name} is not running")
-            return {"error": "Container not running"}
+            return [{"error": "Container not running"} for _ in calls]
 
-        try:
-            # Create the MCP request
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments
-                }
-            }
+        with self._lock:
+            try:
+                process = self._ensure_proc()
 
-            # Execute the request in the container
-            cmd = [
-                "docker", "exec", "-i", self.container_name,
-                "python", "/app/mcp_stock_server.py"
-            ]
-
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-
-            # Send initialize request first
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 0,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {"tools": {}},
-                    "clientInfo": {"name": "docker-client", "version": "1.0.0"}
-                }
-            }
+                # Pipeline every MCP request before reading any response
+                request_ids = []
+                for tool_name, arguments in calls:
+                    request = {
+                        "jsonrpc": "2.0",
+                        "id": self._next_id,
+                        "method": "tools/call",
+                        "params": {
+                            "name": tool_name,
+                            "arguments": arguments
+                        }
+                    }
+                    request_ids.append(self._next_id)
+                    self._next_id += 1
+                    process.stdin.write(json.dumps(request).encode() + b"\n")
+                process.stdin.flush()
 
-            process.stdin.write(json.dumps(init_request) + "\n")
-            process.stdin.write('{"jsonrpc": "2.0", "method": "notifications/initialized"}\n')
-            process.stdin.write(json.dumps(request) + "\n")
-            process.stdin.flush()
-            process.stdin.close()
+                # Replies may arrive in any order; match them back up by id
+                replies = self._read_responses(request_ids, time.monotonic() + REQUEST_TIMEOUT_SECONDS)
 
-            # Read responses
-            output, error = process.communicate(timeout=30)
-            
-            if process.returncode == 0:
-                # Parse the last line which should be our tool response
-                lines = [line.strip() for line in output.split('\n') if line.strip()]
-                if lines:
-                    try:
-                        response = json.loads(lines[-1])
-                        if "result" in response and "content" in response["result"]:
-                            content = response["result"]["content"][0]["text"]
-                            return json.loads(content)
-                    except json.JSONDecodeError:
-                        pass
-                        
-                return {"raw_output": output, "error": error}
-            else:
-                return {"error": f"Command failed: {error}"}
-                
-        except subprocess.TimeoutExpired:
-            return {"error": "Request timed out"}
-        except Exception as e:
-            return {"error": f"Exception: {e}"}
+                return [
+                    self._tool_result(replies[request_id]) if request_id in replies
+                    else {"error": "MCP server closed the connection"}
+                    for request_id in request_ids
+                ]
+
+            except TimeoutError:
+                # A wedged server is killed so the next query starts a fresh session
+                self.close(kill=True)
+                return [{"error": "Request timed out"} for _ in calls]
+            except Exception as e:
+                self.close()
+                return [{"error": f"Exception: {e}"} for _ in calls]
+
+    def query_stock_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Query a stock tool in the MCP server running in Docker"""
+        return self.query_stock_tools([(tool_name, arguments)])[0]
 
     def get_stock_price(self, symbol: str) -> Dict[str, Any]:
         """Get current stock price"""
@@ -140,7 +275,7 @@ def main():
     """Main function for command line usage"""
     if len(sys.argv) < 3:
         print("Usage: python docker_mcp_client.py <tool> <symbol> [period]")
-        print("Tools: price, info, history")
+        print("Tools: price, info, history, all")
         print("Example: python docker_mcp_client.py price AAPL")
         sys.exit(1)
 
@@ -162,10 +297,19 @@ def main():
         result = client.get_stock_info(symbol)
     elif tool == "history":
         result = client.get_stock_history(symbol, period)
+    elif tool == "all":
+        price, info, history = client.query_stock_tools([
+            ("get_stock_price", {"symbol": symbol}),
+            ("get_stock_info", {"symbol": symbol}),
+            ("get_stock_history", {"symbol": symbol, "period": period}),
+        ])
+        result = {"price": price, "info": info, "history": history}
     else:
         print(f"❌ Unknown tool: {tool}")
         sys.exit(1)
 
+    client.close()
+
     print("\n📊 Result:")
     print(json.dumps(result, indent=2))
 
@@ -5,11 +5,19 @@ This server provides stock quote functionality through the Model Context Protoco
 """
 
 import asyncio
-import json
+import atexit
+import concurrent.futures
+import functools
+import queue
 import sys
 import logging
+import logging.handlers
 import os
+import time
+from dataclasses import dataclass
 from typing import Any, Sequence
+import orjson
+import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
 
@@ -25,17 +33,40 @@ from mcp.types import (
 )
 import mcp.types as types
 
+# Shared result cache across server processes when Redis is available (and REDIS_HOST is set)
+try:
+    import redis.asyncio as aioredis
+    USING_REDIS = True
+except ImportError:
+    USING_REDIS = False
+
+# Faster event loop for the stdio transport where available (not on Windows)
+try:
+    import uvloop
+    USING_UVLOOP = True
+except ImportError:
+    USING_UVLOOP = False
+
 # Set up enhanced logging for Docker monitoring
 log_dir = "logs"
 if not os.path.exists(log_dir):
     os.makedirs(log_dir)
 
+# Log calls only enqueue records; a listener thread does the file writes off the request path.
+# Records are formatted by the QueueHandler, so the file handler writes them as-is.
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue, logging.FileHandler(f'{log_dir}/mcp_stock_server.log')
+)
+log_listener.start()
+atexit.register(log_listener.stop)  # flush queued records on shutdown
+
 # Configure detailed logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
     handlers=[
-        logging.FileHandler(f'{log_dir}/mcp_stock_server.log'),
+        logging.handlers.QueueHandler(log_queue),
         # Note: Removed stdout handler to avoid interfering with MCP JSON protocol
         # For Docker: logs will be in the log file, use docker exec to view them
     ]
@@ -47,82 +78,549 @@ logger.info("MCP Stock Server starting up...")
 logger.info(f"Log directory: {log_dir}")
 logger.info("Running locally")
 
+# Per-request stderr traces and request banners are off unless MCP_DEBUG=1
+MCP_DEBUG = os.getenv("MCP_DEBUG") == "1"
+
 # Create a server instance
 server = Server("stock-server")
 
+# Blocking yfinance calls run on their own pool so they never queue behind other executor work
+YF_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="yf")
+
+# Concurrent history lookups arriving within this window are coalesced into one download
+BATCH_WINDOW_SECONDS = 0.05
+BATCH_MAX_SYMBOLS = 20
+
+def _download_history(symbols: list[str], period: str) -> pd.DataFrame:
+    """Fetch history for several symbols in one Yahoo request"""
+    return yf.download(
+        tickers=" ".join(symbols),
+        period=period,
+        group_by="ticker",
+        auto_adjust=True,  # match Ticker.history()
+        threads=False,
+        progress=False,
+    )
+
+def _symbol_history(data: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """Slice one symbol's rows out of a (possibly multi-ticker) download"""
+    if isinstance(data.columns, pd.MultiIndex):
+        if symbol not in data.columns.get_level_values(0):
+            return pd.DataFrame()
+        data = data[symbol]
+    return data.dropna(how="all")
+
+class HistoryBatcher:
+    """Micro-batcher that turns concurrent per-symbol history requests into yf.download calls"""
+
+    def __init__(self):
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def fetch(self, symbol: str, period: str) -> pd.DataFrame:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((symbol, period, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + BATCH_WINDOW_SECONDS
+            while len(batch) < BATCH_MAX_SYMBOLS:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # One download per distinct period in the batch
+            by_period: dict[str, list[tuple[str, asyncio.Future]]] = {}
+            for symbol, period, future in batch:
+                by_period.setdefault(period, []).append((symbol, future))
+
+            for period, waiters in by_period.items():
+                symbols = sorted({symbol for symbol, _ in waiters})
+                try:
+                    data = await loop.run_in_executor(
+                        YF_POOL, functools.partial(_download_history, symbols, period)
+                    )
+                except Exception as e:
+                    for _, future in waiters:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for symbol, future in waiters:
+                    if not future.done():  # the caller may have timed out and cancelled
+                        future.set_result(_symbol_history(data, symbol))
+
+history_batcher = HistoryBatcher()
+
+# Compact output (clients are programs, not people); OPT_SERIALIZE_NUMPY lets numpy
+# scalars from pandas go straight into the payload
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+def to_json(result: dict) -> str:
+    """Serialize a tool result for a TextContent response"""
+    return orjson.dumps(result, option=_JSON_OPTIONS).decode()
+
+# Seconds a cached Yahoo response stays fresh; history TTLs follow the bar size of the period
+INFO_TTL_SECONDS = 900
+NAME_TTL_SECONDS = 86400  # company names rarely change
+QUOTE_TTL_SECONDS = 60
+HISTORY_TTL_SECONDS = {"1d": 60, "5d": 300}
+DEFAULT_HISTORY_TTL_SECONDS = 900
+CACHE_MAX_ENTRIES = 512
+
+# (kind, symbol[, period]) -> (expires_at, payload)
+_response_cache: dict[tuple, tuple[float, Any]] = {}
+
+def _cache_get(key: tuple) -> Any:
+    """Return the cached payload for key if it has not expired, else None"""
+    entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+def _cache_put(key: tuple, value: Any, ttl: float) -> None:
+    """Store a payload, dropping expired (then oldest) entries once the cache is full"""
+    if len(_response_cache) >= CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for stale in [k for k, (expires_at, _) in _response_cache.items() if expires_at <= now]:
+            del _response_cache[stale]
+        if len(_response_cache) >= CACHE_MAX_ENTRIES:
+            del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (time.monotonic() + ttl, value)
+
+# Seconds a finished per-symbol tool result stays in Redis
+REDIS_TTL_SECONDS = {"get_stock_price": 30, "get_stock_info": 3600, "get_stock_history": 300}
+
+_redis = (
+    aioredis.Redis(
+        host=os.environ["REDIS_HOST"],
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        socket_timeout=0.5,
+    )
+    if USING_REDIS and os.getenv("REDIS_HOST") else None
+)
+
+async def _redis_get(key: str) -> dict | None:
+    """Cached tool result from Redis, or None on a miss or when Redis is unavailable"""
+    if _redis is None:
+        return None
+    try:
+        cached = await _redis.get(key)
+    except Exception as e:
+        logger.warning(f"Redis get failed for {key}: {str(e)}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+async def _redis_set(key: str, ttl: int, result: dict) -> None:
+    """Store a tool result in Redis; failures only cost the cache entry"""
+    if _redis is None:
+        return
+    try:
+        await _redis.setex(key, ttl, to_json(result))
+    except Exception as e:
+        logger.warning(f"Redis set failed for {key}: {str(e)}")
+
+async def fetch_info(symbol: str) -> dict:
+    """stock.info for a symbol, served from the TTL cache while fresh"""
+    key = ("info", symbol)
+    info = _cache_get(key)
+    if info is None:
+        loop = asyncio.get_running_loop()
+        info = await loop.run_in_executor(YF_POOL, lambda: yf.Ticker(symbol).info)
+        _cache_put(key, info, INFO_TTL_SECONDS)
+    return info
+
+async def fetch_company_name(symbol: str) -> str:
+    """Company name for a symbol: from cached info when present, otherwise one info lookup kept for a day"""
+    info = _cache_get(("info", symbol))
+    if info is not None:
+        return info.get('longName', 'N/A')
+    key = ("name", symbol)
+    name = _cache_get(key)
+    if name is None:
+        info = await fetch_info(symbol)
+        name = info.get('longName', 'N/A')
+        _cache_put(key, name, NAME_TTL_SECONDS)
+    return name
+
+# The only quote fields get_stock_price needs; fast_info serves them without the full info blob
+_QUOTE_FIELDS = ("lastPrice", "lastVolume", "previousClose", "marketCap", "currency")
+
+def _load_quote(symbol: str) -> dict:
+    """Read the price-related fields from yfinance's lightweight fast_info"""
+    fast_info = yf.Ticker(symbol).fast_info
+    quote = {}
+    for field in _QUOTE_FIELDS:
+        value = fast_info.get(field)
+        if value is not None:
+            quote[field] = value
+    return quote
+
+async def fetch_quote(symbol: str) -> dict:
+    """Price-related quote fields for a symbol, served from the TTL cache while fresh"""
+    key = ("quote", symbol)
+    quote = _cache_get(key)
+    if quote is None:
+        loop = asyncio.get_running_loop()
+        quote = await loop.run_in_executor(YF_POOL, _load_quote, symbol)
+        _cache_put(key, quote, QUOTE_TTL_SECONDS)
+    return quote
+
+async def fetch_history(symbol: str, period: str) -> pd.DataFrame:
+    """Price history for a symbol, served from the TTL cache while fresh"""
+    key = ("history", symbol, period)
+    hist = _cache_get(key)
+    if hist is None:
+        hist = await history_batcher.fetch(symbol, period)
+        if not hist.empty:
+            _cache_put(key, hist, HISTORY_TTL_SECONDS.get(period, DEFAULT_HISTORY_TTL_SECONDS))
+    return hist
+
+# Periods yfinance accepts for history; anything else is rejected before a network call
+VALID_PERIODS = frozenset({"1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"})
+
+# Every tool takes one ticker or a list of tickers (fetched together, returned as a JSON array)
+SYMBOL_SCHEMA = {
+    "anyOf": [
+        {"type": "string"},
+        {"type": "array", "items": {"type": "string"}, "minItems": 1},
+    ],
+    "description": "Stock ticker symbol (e.g., AAPL, GOOGL, MSFT), or several as a list or comma-separated string",
+}
+
+# The tool schemas are static, so the list is built once at import
+_TOOLS = [
+    Tool(
+        name="get_stock_price",
+        description="Get current stock price and basic information for a given ticker symbol",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": SYMBOL_SCHEMA
+            },
+            "required": ["symbol"],
+        },
+    ),
+    Tool(
+        name="get_stock_info",
+        description="Get detailed company information and financial metrics for a given ticker symbol",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": SYMBOL_SCHEMA
+            },
+            "required": ["symbol"],
+        },
+    ),
+    Tool(
+        name="get_stock_history",
+        description="Get historical stock price data for a given ticker symbol",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": SYMBOL_SCHEMA,
+                "period": {
+                    "type": "string",
+                    "description": "Time period for historical data (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)",
+                    "default": "1mo"
+                }
+            },
+            "required": ["symbol"],
+        },
+    ),
+]
+
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
     """
     List available tools.
     Each tool specifies its arguments using JSON Schema validation.
     """
-    return [
-        Tool(
-            name="get_stock_price",
-            description="Get current stock price and basic information for a given ticker symbol",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, GOOGL, MSFT)",
-                    }
-                },
-                "required": ["symbol"],
-            },
-        ),
-        Tool(
-            name="get_stock_info",
-            description="Get detailed company information and financial metrics for a given ticker symbol",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, GOOGL, MSFT)",
-                    }
-                },
-                "required": ["symbol"],
-            },
-        ),
-        Tool(
-            name="get_stock_history",
-            description="Get historical stock price data for a given ticker symbol",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, GOOGL, MSFT)",
-                    },
-                    "period": {
-                        "type": "string",
-                        "description": "Time period for historical data (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)",
-                        "default": "1mo"
-                    }
-                },
-                "required": ["symbol"],
-            },
-        ),
+    return _TOOLS
+
+
+
+class ToolDataError(Exception):
+    """A per-symbol failure whose message is sent back to the client as the tool's text"""
+
+async def _stock_price(sym: str, period: str, now_str: str) -> dict:
+    """Build the get_stock_price result for one symbol"""
+    if MCP_DEBUG:
+        print(f"DEBUG: Getting info for {sym}", file=sys.stderr)
+    
+    # Wrap the blocking yfinance calls with timeout
+    try:
+        if MCP_DEBUG:
+            print(f"DEBUG: Getting stock quote with timeout...", file=sys.stderr)
+        info = await asyncio.wait_for(fetch_quote(sym), timeout=10.0)
+        current_price = info.get('lastPrice')
+        volume = info.get('lastVolume')
+        
+        # The quote normally carries the live price; only fall back to 1d history without it
+        if current_price is None:
+            if MCP_DEBUG:
+                print(f"DEBUG: Quote has no price, getting stock history with timeout...", file=sys.stderr)
+            hist = await asyncio.wait_for(fetch_history(sym, "1d"), timeout=10.0)
+            if hist.empty:
+                raise ToolDataError(f"No data found for symbol: {sym}")
+            current_price = hist['Close'].iloc[-1]
+            volume = hist['Volume'].iloc[-1]
+        if MCP_DEBUG:
+            print(f"DEBUG: Got stock price successfully", file=sys.stderr)
+        
+    except asyncio.TimeoutError:
+        if MCP_DEBUG:
+            print(f"DEBUG: Timeout occurred getting data for {sym}", file=sys.stderr)
+        raise ToolDataError(f"Timeout getting data for {sym}. Please try again later.")
+    
+    # fast_info has no company name; a failed name lookup must not fail the price itself
+    try:
+        company_name = await asyncio.wait_for(fetch_company_name(sym), timeout=10.0)
+    except Exception as e:
+        logger.warning(f"Company name lookup failed for {sym}: {str(e)}")
+        company_name = 'N/A'
+    
+    previous_close = info.get('previousClose', current_price)
+    change = current_price - previous_close            
+    change_percent = (change / previous_close) * 100 if previous_close else 0
+    
+    result = {
+        "_mcp_tool_info": {
+            "tool_name": "get_stock_price",
+            "server": "AILearning_StockServer",
+            "data_source": "Custom_YFinance_Server",
+            "query_timestamp": now_str
+        },
+        "_tool_attribution": "DATA retrieved using: get_stock_price tool",
+        "symbol": sym,
+        "company_name": company_name,
+        "current_price": round(current_price, 2),
+        "previous_close": round(previous_close, 2),
+        "change": round(change, 2),
+        "change_percent": round(change_percent, 2),
+        "volume": int(volume) if pd.notna(volume) else 0,
+        "market_cap": int(info.get('marketCap', 0)) if info.get('marketCap') and info.get('marketCap') != 'N/A' else 'N/A',
+        "currency": info.get('currency', 'USD'),
+        "last_updated": now_str
+    }
+    
+    logger.info(f"Successfully retrieved stock price for {sym}")
+    return result
+
+def safe_convert(value, convert_func=float, default='N/A'):
+    """Convert an info field, falling back to default when it is missing or malformed"""
+    try:
+        if value is None or value == 'N/A':
+            return default
+        return convert_func(value)
+    except (ValueError, TypeError):
+        return default
+
+async def _stock_info(sym: str, period: str, now_str: str) -> dict:
+    """Build the get_stock_info result for one symbol"""
+    info = await fetch_info(sym)
+    
+    # Truncate long business summaries to 500 characters
+    business_summary = info.get('longBusinessSummary') or 'N/A'
+    if len(business_summary) > 500:
+        business_summary = business_summary[:500] + "..."
+    
+    result = {
+        "_mcp_tool_info": {
+            "tool_name": "get_stock_info",
+            "server": "AILearning_StockServer",
+            "data_source": "Custom_YFinance_Server",
+            "query_timestamp": now_str
+        },
+        "_tool_attribution": "DATA retrieved using: get_stock_info tool",
+        "symbol": sym,
+        "company_name": info.get('longName', 'N/A'),
+        "sector": info.get('sector', 'N/A'),
+        "industry": info.get('industry', 'N/A'),
+        "market_cap": safe_convert(info.get('marketCap'), int),
+        "enterprise_value": safe_convert(info.get('enterpriseValue'), int),
+        "pe_ratio": safe_convert(info.get('trailingPE'), float),
+        "forward_pe": safe_convert(info.get('forwardPE'), float),
+        "price_to_book": safe_convert(info.get('priceToBook'), float),
+        "dividend_yield": safe_convert(info.get('dividendYield'), float),
+        "beta": safe_convert(info.get('beta'), float),
+        "52_week_high": safe_convert(info.get('fiftyTwoWeekHigh'), float),
+        "52_week_low": safe_convert(info.get('fiftyTwoWeekLow'), float),
+        "average_volume": safe_convert(info.get('averageVolume'), int),
+        "website": info.get('website', 'N/A'),
+        "business_summary": business_summary,
+        "last_updated": now_str
+    }
+    
+    logger.info(f"Successfully retrieved stock info for {sym}")
+    return result
+
+# Decimal places for each price column in history records
+_PRICE_ROUNDING = {'Open': 2, 'High': 2, 'Low': 2, 'Close': 2}
+
+@dataclass(slots=True)
+class HistoryRow:
+    """One history record; orjson serializes slotted dataclasses natively as JSON objects"""
+    date: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
+async def _stock_history(sym: str, period: str, now_str: str) -> dict:
+    """Build the get_stock_history result for one symbol"""
+    hist = await fetch_history(sym, period)
+    
+    if hist.empty:
+        raise ToolDataError(f"No historical data found for symbol: {sym}")
+    
+    # Summary stats cover the whole period (rounding commutes with max/min)
+    summary = {
+        "start_date": hist.index[0].strftime("%Y-%m-%d"),
+        "end_date": hist.index[-1].strftime("%Y-%m-%d"),
+        "highest_price": round(float(hist['High'].max()), 2),
+        "lowest_price": round(float(hist['Low'].min()), 2),
+        "average_volume": float(hist['Volume'].fillna(0).mean())
+    }
+    
+    # Only the last 10 data points are returned, so only those are rounded and converted to records.
+    # The prices are rounded in one DataFrame call, pulled out as plain lists, then zipped row-wise.
+    tail = hist.tail(10).round(_PRICE_ROUNDING)
+    dates = tail.index.strftime("%Y-%m-%d").tolist()
+    opens, highs, lows, closes = (tail[column].tolist() for column in ('Open', 'High', 'Low', 'Close'))
+    volumes = tail['Volume'].fillna(0).astype("int64").tolist()
+    history_data = [
+        HistoryRow(*row) for row in zip(dates, opens, highs, lows, closes, volumes)
     ]
+    
+    result = {
+        "_mcp_tool_info": {
+            "tool_name": "get_stock_history",
+            "server": "AILearning_StockServer",
+            "data_source": "Custom_YFinance_Server",
+            "query_timestamp": now_str
+        },
+        "_tool_attribution": "DATA retrieved using: get_stock_history tool",
+        "symbol": sym,
+        "period": period,
+        "data_points": len(hist),
+        "history": history_data,  # Return last 10 data points
+        "summary": summary,
+        "last_updated": now_str
+    }
+    
+    logger.info(f"Successfully retrieved stock history for {sym} (period: {period})")
+    return result
+
+# What each tool's "Error fetching ..." message calls the data it failed to get
+_ERROR_LABELS = {
+    "get_stock_price": "stock data",
+    "get_stock_info": "stock info",
+    "get_stock_history": "stock history",
+}
+
+def _parse_symbols(value: Any) -> list[str]:
+    """Normalize the symbol argument (a ticker, "AAPL,MSFT" or a list) to unique upper-case symbols"""
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        return []
+    symbols = (symbol.strip().upper() for symbol in value if isinstance(symbol, str))
+    return list(dict.fromkeys(symbol for symbol in symbols if symbol))
 
+# Tool name -> per-symbol result builder. All builders share the (sym, period, now_str)
+# signature; period is "" for tools that do not take one.
+_HANDLERS = {
+    "get_stock_price": _stock_price,
+    "get_stock_info": _stock_info,
+    "get_stock_history": _stock_history,
+}
+_PERIOD_TOOLS = frozenset({"get_stock_history"})
 
+def _parse_period(arguments: dict[str, Any]) -> str:
+    """Validate and normalize the history period argument"""
+    period = arguments.get("period", "1mo")
+    if isinstance(period, str):
+        period = period.lower()
+    if not isinstance(period, str) or period not in VALID_PERIODS:
+        raise ValueError(f"Invalid period: {period}. Expected one of: {', '.join(sorted(VALID_PERIODS))}")
+    return period
+
+async def _load_symbol_result(name: str, sym: str, build, period: str) -> dict | str:
+    """Run one symbol's builder (Redis first); failures come back as the error text for that symbol"""
+    key = f"{name}:{sym}:{period}"
+    cached = await _redis_get(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        result = await build(sym)
+    except ToolDataError as e:
+        return str(e)
+    except Exception as e:
+        message = f"Error fetching {_ERROR_LABELS[name]} for {sym}: {str(e)}"
+        logger.error(message)
+        return message
+    
+    await _redis_set(key, REDIS_TTL_SECONDS[name], result)
+    return result
+
+def _stamp(result: dict | str, now_str: str) -> dict | str:
+    """Copy of a (possibly cached or shared) result carrying this request's timestamps"""
+    if not isinstance(result, dict):
+        return result
+    return {
+        **result,
+        "_mcp_tool_info": {**result["_mcp_tool_info"], "query_timestamp": now_str},
+        "last_updated": now_str,
+    }
+
+# (tool, symbol, period) -> the fetch currently running for it, shared by identical concurrent calls
+_inflight: dict[tuple[str, str, str], asyncio.Task] = {}
+
+async def _symbol_result(name: str, sym: str, build, now_str: str, period: str = "") -> dict | str:
+    """One symbol's result, joining an identical in-flight fetch instead of starting another"""
+    key = (name, sym, period)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_load_symbol_result(name, sym, build, period))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller being cancelled does not cancel the fetch for the others.
+    # Redis hits and joined fetches carry another request's timestamps, so restamp per caller
+    return _stamp(await asyncio.shield(task), now_str)
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """
     Handle tool execution requests with enhanced logging for Docker monitoring.
+    A list of symbols is fetched concurrently and returned as one JSON array.
     """
-    # Debug logging to stderr to see if handler is called
-    print(f"DEBUG: handle_call_tool called with name={name}, args={arguments}", file=sys.stderr)
+    # One timestamp per request, shared by the banner and the result dicts
+    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    # Debug logging to stderr to see if handler is called (MCP_DEBUG=1 only)
+    if MCP_DEBUG:
+        print(f"DEBUG: handle_call_tool called with name={name}, args={arguments}", file=sys.stderr)
     
     # Enhanced request logging for Docker Desktop visibility
-    logger.info("FIRE" + "=" * 58 + "FIRE")
-    logger.info("INCOMING MCP REQUEST")
-    logger.info(f"Tool Requested: {name}")
-    logger.info(f"Arguments: {arguments}")
-    logger.info(f"Request Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info("FIRE" + "=" * 58 + "FIRE")
+    if MCP_DEBUG:
+        logger.info("FIRE" + "=" * 58 + "FIRE")
+        logger.info("INCOMING MCP REQUEST")
+        logger.info(f"Tool Requested: {name}")
+        logger.info(f"Arguments: {arguments}")
+        logger.info(f"Request Time: {now_str}")
+        logger.info("FIRE" + "=" * 58 + "FIRE")
     
     if not arguments:
         logger.error("ERROR: Missing arguments in request")
@@ -131,217 +629,31 @@ async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[
     # Log tool usage (original logging)
     logger.info(f"Tool called: {name} with arguments: {arguments}")
 
-    if name == "get_stock_price":
-        print(f"DEBUG: Processing get_stock_price for symbol: {arguments.get('symbol') if arguments else 'None'}", file=sys.stderr)
-        symbol = arguments.get("symbol")
-        if not symbol:
-            print("DEBUG: Missing symbol argument", file=sys.stderr)
-            raise ValueError("Missing symbol argument")
-            
-        try:
-            print(f"DEBUG: Creating yf.Ticker for {symbol}", file=sys.stderr)
-            stock = yf.Ticker(symbol.upper())
-            print(f"DEBUG: Getting info for {symbol}", file=sys.stderr)
-            
-            # Add timeout handling for yfinance calls
-            import asyncio
-            import functools
-            
-            # Wrap the blocking yfinance calls with timeout
-            loop = asyncio.get_event_loop()
-            
-            try:
-                # Get info with timeout
-                print(f"DEBUG: Getting stock info with timeout...", file=sys.stderr)
-                info = await asyncio.wait_for(
-                    loop.run_in_executor(None, lambda: stock.info),
-                    timeout=10.0
-                )
-                print(f"DEBUG: Got stock info successfully", file=sys.stderr)
-                
-                # Get history with timeout
-                print(f"DEBUG: Getting stock history with timeout...", file=sys.stderr)
-                hist = await asyncio.wait_for(
-                    loop.run_in_executor(None, lambda: stock.history(period="1d")),
-                    timeout=10.0
-                )
-                print(f"DEBUG: Got stock history successfully", file=sys.stderr)
-                
-            except asyncio.TimeoutError:
-                print(f"DEBUG: Timeout occurred getting data for {symbol}", file=sys.stderr)
-                return [types.TextContent(
-                    type="text",
-                    text=f"Timeout getting data for {symbol}. Please try again later."
-                )]
-            
-            if hist.empty:
-                return [types.TextContent(
-                    type="text",
-                    text=f"No data found for symbol: {symbol}"
-                )]
-            
-            current_price = hist['Close'].iloc[-1]
-            previous_close = info.get('previousClose', hist['Close'].iloc[-1])
-            change = current_price - previous_close            
-            change_percent = (change / previous_close) * 100 if previous_close else 0
-            
-            result = {
-                "_mcp_tool_info": {
-                    "tool_name": "get_stock_price",
-                    "server": "AILearning_StockServer",
-                    "data_source": "Custom_YFinance_Server",
-                    "query_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                },
-                "_tool_attribution": "DATA retrieved using: get_stock_price tool",
-                "symbol": symbol.upper(),
-                "company_name": info.get('longName', 'N/A'),
-                "current_price": round(float(current_price), 2),
-                "previous_close": round(float(previous_close), 2),
-                "change": round(float(change), 2),
-                "change_percent": round(float(change_percent), 2),
-                "volume": int(hist['Volume'].iloc[-1]) if not hist['Volume'].empty else 0,
-                "market_cap": int(info.get('marketCap', 0)) if info.get('marketCap') and info.get('marketCap') != 'N/A' else 'N/A',
-                "currency": info.get('currency', 'USD'),
-                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            logger.info(f"Successfully retrieved stock price for {symbol}")
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
-            
-        except Exception as e:
-            logger.error(f"Error fetching stock data for {symbol}: {str(e)}")
-            return [types.TextContent(
-                type="text",
-                text=f"Error fetching stock data for {symbol}: {str(e)}"
-            )]
-    
-    elif name == "get_stock_info":
-        symbol = arguments.get("symbol")
-        if not symbol:
-            raise ValueError("Missing symbol argument")
-            
-        try:
-            stock = yf.Ticker(symbol.upper())
-            info = stock.info
-            
-            # Helper function to safely convert values
-            def safe_convert(value, convert_func=float, default='N/A'):
-                try:
-                    if value is None or value == 'N/A':
-                        return default
-                    return convert_func(value)
-                except (ValueError, TypeError):
-                    return default
-            
-            result = {
-                "_mcp_tool_info": {
-                    "tool_name": "get_stock_info",
-                    "server": "AILearning_StockServer",
-                    "data_source": "Custom_YFinance_Server",
-                    "query_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                },
-                "_tool_attribution": "DATA retrieved using: get_stock_info tool",
-                "symbol": symbol.upper(),
-                "company_name": info.get('longName', 'N/A'),
-                "sector": info.get('sector', 'N/A'),
-                "industry": info.get('industry', 'N/A'),
-                "market_cap": safe_convert(info.get('marketCap'), int),
-                "enterprise_value": safe_convert(info.get('enterpriseValue'), int),
-                "pe_ratio": safe_convert(info.get('trailingPE'), float),
-                "forward_pe": safe_convert(info.get('forwardPE'), float),
-                "price_to_book": safe_convert(info.get('priceToBook'), float),
-                "dividend_yield": safe_convert(info.get('dividendYield'), float),
-                "beta": safe_convert(info.get('beta'), float),
-                "52_week_high": safe_convert(info.get('fiftyTwoWeekHigh'), float),
-                "52_week_low": safe_convert(info.get('fiftyTwoWeekLow'), float),
-                "average_volume": safe_convert(info.get('averageVolume'), int),
-                "website": info.get('website', 'N/A'),
-                "business_summary": info.get('longBusinessSummary', 'N/A')[:500] + "..." if info.get('longBusinessSummary') and len(info.get('longBusinessSummary', '')) > 500 else info.get('longBusinessSummary', 'N/A'),
-                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            logger.info(f"Successfully retrieved stock info for {symbol}")
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
-            
-        except Exception as e:
-            logger.error(f"Error fetching stock info for {symbol}: {str(e)}")
-            return [types.TextContent(
-                type="text",
-                text=f"Error fetching stock info for {symbol}: {str(e)}"
-            )]
-    
-    elif name == "get_stock_history":
-        symbol = arguments.get("symbol")
-        period = arguments.get("period", "1mo")
-        
-        if not symbol:
-            raise ValueError("Missing symbol argument")
-            
-        try:
-            stock = yf.Ticker(symbol.upper())
-            hist = stock.history(period=period)
-            
-            if hist.empty:
-                return [types.TextContent(
-                    type="text",
-                    text=f"No historical data found for symbol: {symbol}"
-                )]
-            
-            # Convert to a list of dictionaries for JSON serialization
-            history_data = []
-            for date, row in hist.iterrows():
-                history_data.append({
-                    "date": date.strftime("%Y-%m-%d"),
-                    "open": round(float(row['Open']), 2),
-                    "high": round(float(row['High']), 2),
-                    "low": round(float(row['Low']), 2),
-                    "close": round(float(row['Close']), 2),
-                    "volume": int(row['Volume'])
-                })
-            
-            result = {
-                "_mcp_tool_info": {
-                    "tool_name": "get_stock_history",
-                    "server": "AILearning_StockServer",
-                    "data_source": "Custom_YFinance_Server",
-                    "query_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                },
-                "_tool_attribution": "DATA retrieved using: get_stock_history tool",
-                "symbol": symbol.upper(),
-                "period": period,
-                "data_points": len(history_data),
-                "history": history_data[-10:] if len(history_data) > 10 else history_data,  # Return last 10 data points
-                "summary": {
-                    "start_date": history_data[0]["date"] if history_data else "N/A",
-                    "end_date": history_data[-1]["date"] if history_data else "N/A",
-                    "highest_price": max([d["high"] for d in history_data]) if history_data else 0,
-                    "lowest_price": min([d["low"] for d in history_data]) if history_data else 0,
-                    "average_volume": sum([d["volume"] for d in history_data]) / len(history_data) if history_data else 0
-                },
-                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            logger.info(f"Successfully retrieved stock history for {symbol} (period: {period})")
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
-        except Exception as e:
-            logger.error(f"Error fetching stock history for {symbol}: {str(e)}")
-            return [types.TextContent(
-                type="text",
-                text=f"Error fetching stock history for {symbol}: {str(e)}"
-            )]
-    
-    else:
+    handler = _HANDLERS.get(name)
+    if handler is None:
         logger.error(f"ERROR: Unknown tool requested: {name}")
         raise ValueError(f"Unknown tool: {name}")
+    period = _parse_period(arguments) if name in _PERIOD_TOOLS else ""
+    build = functools.partial(handler, period=period, now_str=now_str)
+
+    symbols = _parse_symbols(arguments.get("symbol"))
+    if not symbols:
+        if MCP_DEBUG:
+            print("DEBUG: Missing symbol argument", file=sys.stderr)
+        raise ValueError("Missing symbol argument")
+
+    # Concurrent per-symbol fetches let the history batcher coalesce them into one download
+    results = await asyncio.gather(*(_symbol_result(name, sym, build, now_str, period) for sym in symbols))
+
+    if len(results) == 1:
+        result = results[0]
+        text = result if isinstance(result, str) else to_json(result)
+    else:
+        text = to_json([
+            result if isinstance(result, dict) else {"symbol": sym, "error": result}
+            for sym, result in zip(symbols, results)
+        ])
+    return [types.TextContent(type="text", text=text)]
 
 # Add this function to wrap all responses with logging
 def log_response(tool_name: str, result: list[types.TextContent]) -> list[types.TextContent]:
@@ -373,4 +685,7 @@ async def main():
         )
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if USING_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
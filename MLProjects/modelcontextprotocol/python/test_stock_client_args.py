@@ -1,241 +1,215 @@
 ﻿#!/usr/bin/env python3
 """
 Command-line argument test client for the MCP stock server
-Usage: python test_stock_client_args.py --option 1 --symbol AAPL [--period 1mo]
+Usage: python test_stock_client_args.py --option 1 --symbol AAPL [MSFT ...] [--period 1mo]
 """
 
 import asyncio
 import json
-import subprocess
+import re
 import sys
 import argparse
-from typing import Any, Dict
+import orjson
+from typing import Any, Dict, List
 
-async def test_mcp_stock_server(option: str, symbol: str, period: str = "1mo"):
-    """Test the MCP stock server with provided arguments"""
+SERVER_PATH = r"D:\Study\AILearning\MLProjects\modelcontextprotocol\python\mcp_stock_server.py"
+PYTHON_PATH = r"D:/Study/AILearning/shared_Environment/Scripts/python.exe"
+
+# Menu option -> (tool name, what is being fetched)
+TOOL_OPTIONS = {
+    "1": ("get_stock_price", "stock price"),
+    "2": ("get_stock_info", "stock info"),
+    "3": ("get_stock_history", "stock history"),
+}
+
+# Ticker symbols: 1-5 ASCII letters, checked after upper-casing
+_SYM = re.compile(r'[A-Z]{1,5}')
+
+# A history reply is a single JSON line that can outgrow asyncio's 64 KiB default readline limit
+STDOUT_LIMIT = 16 * 1024 * 1024
+
+class MCPStockClient:
+    """One MCP stock server process and session, reused for every tool call made through it"""
+
+    def __init__(self, python_path: str = PYTHON_PATH, server_path: str = SERVER_PATH):
+        self.python_path = python_path
+        self.server_path = server_path
+        self.process = None
+        self._next_id = 1
+
+    async def __aenter__(self):
+        # stderr is discarded: nothing reads it, and a full pipe would stall a long-lived server
+        self.process = await asyncio.create_subprocess_exec(
+            self.python_path, self.server_path,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=STDOUT_LIMIT
+        )
+        try:
+            await self._init()
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Clean up
+        if self.process is not None and self.process.returncode is None:
+            self.process.terminate()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+
+    async def _send(self, message: Dict[str, Any]):
+        # Outgoing requests are tiny, so the stdlib encoder is kept for them
+        self.process.stdin.write((json.dumps(message) + '\n').encode())
+        await self.process.stdin.drain()
+
+    async def _request(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one JSON-RPC request and wait for the response with the same id"""
+        request_id = self._next_id
+        self._next_id += 1
+        await self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            response = await asyncio.wait_for(
+                self.process.stdout.readline(),
+                timeout=max(deadline - loop.time(), 0)
+            )
+            if not response:
+                raise ConnectionError("MCP server closed the connection")
+            # Skip log lines and notifications interleaved with the reply
+            try:
+                message = orjson.loads(response)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(message, dict) and message.get("id") == request_id:
+                return message
+
+    async def _init(self):
+        """Run the initialize handshake and fetch the tool list once per session"""
+        await self._request("initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {
+                "name": "args-test-client",
+                "version": "1.0.0"
+            }
+        }, timeout=10.0)
+        print("Server initialized successfully")
+
+        # Send initialized notification (required by MCP protocol)
+        await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+        await self._request("tools/list", {}, timeout=10.0)
+        print("Available tools retrieved")
+
+    async def call(self, name: str, arguments: Dict[str, Any], timeout: float = 30.0) -> Dict[str, Any]:
+        """Call one tool over the open session"""
+        return await self._request("tools/call", {"name": name, "arguments": arguments}, timeout=timeout)
+
+def print_response(result: Dict[str, Any]):
+    """Print a tools/call response"""
+    if "result" in result:
+        print()
+        print("Response from MCP Stock Server:")
+        print("-" * 50)
+        
+        content = result["result"]["content"]
+        for item in content:
+            if item["type"] == "text":
+                # Pretty print JSON if it looks like JSON
+                text = item["text"]
+                try:
+                    print(orjson.dumps(orjson.loads(text), option=orjson.OPT_INDENT_2).decode())
+                except orjson.JSONDecodeError:
+                    print(text)
+            else:
+                print(f"Content type: {item['type']}")
+                print(item)
+        
+        print("-" * 50)
+        print("Request completed successfully!")
+        
+    elif "error" in result:
+        print()
+        print(" Error from server:")
+        print(f"   Code: {result['error']['code']}")
+        print(f"   Message: {result['error']['message']}")
+        
+    else:
+        print("Unexpected response format:")
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+
+async def test_mcp_stock_server(option: str, symbols: List[str], period: str = "1mo"):
+    """Test the MCP stock server with provided arguments, reusing one server session for all symbols"""
     
     print()
     print("Executing MCP Stock Server request...")
     print(f"   Option: {option}")
-    print(f"   Symbol: {symbol}")
+    print(f"   Symbol: {', '.join(symbols)}")
     if option == "3":
         print(f"   Period: {period}")
     print("-" * 50)
     
-    # Start the server process
-    server_path = r"D:\Study\AILearning\MLProjects\modelcontextprotocol\python\mcp_stock_server.py"
-    python_path = r"D:/Study/AILearning/shared_Environment/Scripts/python.exe"
-    
-    process = subprocess.Popen(
-        [python_path, server_path],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    if option not in TOOL_OPTIONS:
+        print(f"Invalid option: {option}")
+        return
+    tool_name, label = TOOL_OPTIONS[option]
     
     try:
-        # Initialize the server
-        init_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "args-test-client",
-                    "version": "1.0.0"
-                }
-            }
-        }
-        
-        # Send initialization
-        process.stdin.write(json.dumps(init_request) + '\n')
-        process.stdin.flush()
-        
-        # Read initialization response with timeout
-        try:
-            response = await asyncio.wait_for(
-                asyncio.create_task(asyncio.to_thread(process.stdout.readline)),
-                timeout=10.0
-            )
-            print("Server initialized successfully")
-        except asyncio.TimeoutError:
-            print("Timeout waiting for server initialization")
-            return
-        
-        # Send initialized notification (required by MCP protocol)
-        initialized_notification = {
-            "jsonrpc": "2.0",
-            "method": "notifications/initialized"
-        }
-        
-        process.stdin.write(json.dumps(initialized_notification) + '\n')
-        process.stdin.flush()
-        
-        # List available tools
-        list_tools_request = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/list",
-            "params": {}
-        }
-        
-        process.stdin.write(json.dumps(list_tools_request) + '\n')
-        process.stdin.flush()
-        
-        try:
-            response = await asyncio.wait_for(
-                asyncio.create_task(asyncio.to_thread(process.stdout.readline)),
-                timeout=10.0
-            )
-            print("Available tools retrieved")
-        except asyncio.TimeoutError:
-            print("Timeout waiting for tools list")
-            return
-        
-        # Build request based on option
-        if option == "1":            
-            stock_request = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {
-                    "name": "get_stock_price",
-                    "arguments": {
-                        "symbol": symbol
-                    }
-                }
-            }
-            print(f"Getting stock price for {symbol}...")
-            
-        elif option == "2":
-            stock_request = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {
-                    "name": "get_stock_info",
-                    "arguments": {
-                        "symbol": symbol
-                    }
-                }
-            }
-            print(f"Getting stock info for {symbol}...")
-            
-        elif option == "3":
-            stock_request = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {
-                    "name": "get_stock_history",
-                    "arguments": {
-                        "symbol": symbol,
-                        "period": period
-                    }
-                }
-            }
-            print(f"Getting stock history for {symbol} (period: {period})...")
-            
-        else:
-            print(f"Invalid option: {option}")
-            return
-        
-        # Send the stock request
-        process.stdin.write(json.dumps(stock_request) + '\n')
-        process.stdin.flush()
-        
-        # Read the response with timeout
-        try:
-            response = await asyncio.wait_for(
-                asyncio.create_task(asyncio.to_thread(process.stdout.readline)),
-                timeout=30.0
-            )
-            
-            if response:
-                result = json.loads(response)
-                
-                if "result" in result:
-                    print()
-                    print("Response from MCP Stock Server:")
-                    print("-" * 50)
-                    
-                    content = result["result"]["content"]
-                    for item in content:
-                        if item["type"] == "text":
-                            # Pretty print JSON if it looks like JSON
-                            text = item["text"]
-                            try:
-                                parsed = json.loads(text)
-                                print(json.dumps(parsed, indent=2))
-                            except:
-                                print(text)
-                        else:
-                            print(f"Content type: {item['type']}")
-                            print(item)
-                    
-                    print("-" * 50)
-                    print("Request completed successfully!")
-                    
-                elif "error" in result:
-                    print()
-                    print(" Error from server:")
-                    print(f"   Code: {result['error']['code']}")
-                    print(f"   Message: {result['error']['message']}")
-                    
+        async with MCPStockClient() as client:
+            for symbol in symbols:
+                arguments = {"symbol": symbol}
+                if option == "3":
+                    arguments["period"] = period
+                    print(f"Getting {label} for {symbol} (period: {period})...")
                 else:
-                    print("Unexpected response format:")
-                    print(json.dumps(result, indent=2))
-                    
-            else:
-                print("No response received from server")
+                    print(f"Getting {label} for {symbol}...")
+                
+                try:
+                    result = await client.call(tool_name, arguments)
+                except asyncio.TimeoutError:
+                    print("Timeout waiting for stock data response")
+                    return
                 
-        except asyncio.TimeoutError:
-            print("Timeout waiting for stock data response")
-            return
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse server response: {e}")
-            return
-            
+                print_response(result)
+                
+    except asyncio.TimeoutError:
+        print("Timeout waiting for server initialization")
+    except ConnectionError:
+        print("No response received from server")
     except Exception as e:
         print(f"Error communicating with server: {e}")
-        
-    finally:
-        # Clean up
-        if process.poll() is None:
-            process.terminate()
-            try:
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
 
 def main():
     """Main function with argument parsing"""
     parser = argparse.ArgumentParser(description='Test MCP Stock Server with command line arguments')
     parser.add_argument('-o', '--option', required=True, choices=['1', '2', '3'], 
                         help='Option: 1=price, 2=info, 3=history')
-    parser.add_argument('-s', '--symbol', required=True, 
-                        help='Stock symbol (e.g., AAPL, GOOGL, MSFT)')
+    parser.add_argument('-s', '--symbol', required=True, nargs='+',
+                        help='Stock symbol(s) (e.g., AAPL GOOGL MSFT); all are queried over one server session')
     parser.add_argument('-p', '--period', default='1mo',
                         choices=['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
                         help='Time period for history (default: 1mo)')
     
     args = parser.parse_args()
-      # Validate symbol
-    if not args.symbol.isalpha() or len(args.symbol) > 5:
+    # Normalize to uppercase, then validate every symbol against the same compiled pattern
+    symbols = [symbol.upper() for symbol in args.symbol]
+    if not all(map(_SYM.fullmatch, symbols)):
         print("Invalid symbol. Please enter 1-5 letters only.")
         sys.exit(1)
     
-    # Convert to uppercase
-    symbol = args.symbol.upper()
-    
     print("MCP Stock Server Command Line Test")
     print("=" * 50)
     
     try:
-        asyncio.run(test_mcp_stock_server(args.option, symbol, args.period))
+        asyncio.run(test_mcp_stock_server(args.option, symbols, args.period))
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
         sys.exit(0)
@@ -244,4 +218,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,32 +1,67 @@
+import itertools
+from array import array
+from pathlib import Path
 import torch
 from transformers import GPT2LMHeadModel, GPT2Tokenizer
 from torch.optim import AdamW
+from torch.utils.data import DataLoader
+
+DATA_PATH = Path("resource") / "data.txt"
+BLOCK_SIZE = 512
+BATCH_SIZE = 8
+ACCUM_STEPS = 4  # optimizer step every ACCUM_STEPS batches
 
 # Load the pre-trained GPT-2 tokenizer and model
 tokenizer = GPT2Tokenizer.from_pretrained("gpt2")
 model = GPT2LMHeadModel.from_pretrained("gpt2")
 
-# Load training data
-with open("resource\data.txt", "r") as file:
-    dataset = file.read()
+# Load and tokenize the training data, streaming it 1000 lines at a time so the raw text
+# is never held in memory as one string; token ids go into a compact int64 buffer rather
+# than a list of Python ints
+ids = array("q")
+with DATA_PATH.open("r", encoding="utf-8") as file:
+    while lines := list(itertools.islice(file, 1000)):
+        for line_ids in tokenizer(lines)["input_ids"]:
+            ids.extend(line_ids)
 
-# Tokenize the data
-inputs = tokenizer(dataset, return_tensors="pt", max_length=512, truncation=True)
+# Cut the token stream into BLOCK_SIZE-token training examples
+# (a corpus shorter than one block becomes a single shorter block)
+if not ids:
+    raise ValueError(f"No tokens read from {DATA_PATH}")
+block_size = min(BLOCK_SIZE, len(ids))
+n_blocks = len(ids) // block_size
+blocks = torch.frombuffer(ids, dtype=torch.int64)[:n_blocks * block_size].view(n_blocks, block_size)
 
 print
 
-# Define optimizer
-optimizer = AdamW(model.parameters(), lr=5e-5)
+# Train on the GPU when there is one, under bfloat16 autocast (float16 with loss scaling on GPUs without bf16)
+device = "cuda" if torch.cuda.is_available() else "cpu"
+use_amp = device == "cuda"
+amp_dtype = torch.float16 if use_amp and not torch.cuda.is_bf16_supported() else torch.bfloat16
+scaler = torch.cuda.amp.GradScaler(enabled=use_amp and amp_dtype == torch.float16)
+torch.backends.cuda.matmul.allow_tf32 = True
+model.to(device)
+
+# The blocks are already in memory, so batches come straight from the tensor without worker processes
+loader = DataLoader(blocks, batch_size=BATCH_SIZE, shuffle=True, pin_memory=use_amp)
+
+# Define optimizer (fused CUDA kernel on the GPU)
+optimizer = AdamW(model.parameters(), lr=5e-5, fused=use_amp)
 
 # Training loop (1 epoch for simplicity)
 model.train()
 for epoch in range(1):
-    outputs = model(**inputs, labels=inputs["input_ids"])
-    loss = outputs.loss
-    loss.backward()
-    optimizer.step()
-    optimizer.zero_grad()
-    print(f"Epoch {epoch+1}, Loss: {loss.item()}")
+    for step, batch in enumerate(loader):
+        batch = batch.to(device, non_blocking=True)
+        with torch.autocast(device_type=device, dtype=amp_dtype, enabled=use_amp):
+            outputs = model(batch, labels=batch)
+            loss = outputs.loss / ACCUM_STEPS
+        scaler.scale(loss).backward()
+        if (step + 1) % ACCUM_STEPS == 0 or step + 1 == len(loader):
+            scaler.step(optimizer)
+            scaler.update()
+            optimizer.zero_grad(set_to_none=True)
+    print(f"Epoch {epoch+1}, Loss: {loss.item() * ACCUM_STEPS}")
 
 model.save_pretrained("./gen_ai_model")
 tokenizer.save_pretrained("./gen_ai_model")
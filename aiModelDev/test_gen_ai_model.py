@@ -1,37 +1,86 @@
 import math
+import torch
+import torch.nn.functional as F
 from transformers import GPT2LMHeadModel, GPT2Tokenizer
 
 # Load the fine-tuned model and tokenizer
 tokenizer = GPT2Tokenizer.from_pretrained("./gen_ai_model")
 tokenizer.pad_token = tokenizer.eos_token
 model = GPT2LMHeadModel.from_pretrained("./gen_ai_model")
+model.eval()
+
+# On the GPU, compile the forward pass that generate() calls once per new token.
+# The module's forward is replaced rather than wrapping the model, because generate() on a wrapper
+# would still run the eager forward. The KV cache grows every decode step, so the graph is compiled
+# with dynamic shapes in the default mode; CUDA-graph capture ("reduce-overhead") would re-record
+# per token.
+if torch.cuda.is_available():
+    model.to("cuda")
+    model.forward = torch.compile(model.forward, dynamic=True)
 
 #prompt = "The stars"
 prompt = "bbbbb"
-inputs = tokenizer(prompt, return_tensors="pt", padding=True, truncation=True)
-outputs = model.generate(
-    inputs["input_ids"],
+inputs = tokenizer(prompt, return_tensors="pt", padding=True, truncation=True).to(model.device)
+generate_kwargs = dict(
     attention_mask=inputs["attention_mask"], 
     max_length=50,
     num_return_sequences=1,
     temperature=0.7,
     top_p=0.9,
-    do_sample=True    
+    do_sample=True,
+    use_cache=True,
+    pad_token_id=tokenizer.eos_token_id
 )
+# Throwaway run so compilation happens before the generation that is printed
+if torch.cuda.is_available():
+    model.generate(inputs["input_ids"], **generate_kwargs)
+outputs = model.generate(inputs["input_ids"], **generate_kwargs)
 
 for i, output in enumerate(outputs):
     print(f"Generated Text {i+1}:\n{tokenizer.decode(output, skip_special_tokens=True)}")
 
 
-def calculate_perplexity(text):
-    tokenizer = GPT2Tokenizer.from_pretrained("./gen_ai_model")
-    model = GPT2LMHeadModel.from_pretrained("./gen_ai_model")
-    inputs = tokenizer(text, return_tensors="pt")
-    outputs = model(**inputs, labels=inputs["input_ids"])
-    loss = outputs.loss.item()
-    perplexity = math.exp(loss)
-    return perplexity
+PERPLEXITY_BATCH = 8  # context windows per forward pass
+
+# Reuses the model and tokenizer loaded above; a list of texts is scored in padded batches
+def calculate_perplexity(texts, model=model, tokenizer=tokenizer):
+    single = isinstance(texts, str)
+    texts = [texts] if single else texts
+    # Texts longer than the model's context are split into windows; each text's loss is
+    # averaged over all of its tokens
+    window = model.config.n_positions
+    windows = [
+        (i, ids[start:start + window])
+        for i, ids in enumerate(tokenizer(texts)["input_ids"])
+        for start in range(0, len(ids), window)
+    ]
+    loss_sum = [0.0] * len(texts)
+    token_count = [0] * len(texts)
+    # Scoring only: no autograd graph or version counters
+    with torch.inference_mode():
+        for b in range(0, len(windows), PERPLEXITY_BATCH):
+            owners, chunk = zip(*windows[b:b + PERPLEXITY_BATCH])
+            inputs = tokenizer.pad({"input_ids": list(chunk)}, return_tensors="pt").to(model.device)
+            logits = model(**inputs).logits[:, :-1]
+            labels = inputs["input_ids"][:, 1:]
+            mask = inputs["attention_mask"][:, 1:]
+            # Next-token loss per window, ignoring padding
+            token_loss = F.cross_entropy(logits.transpose(1, 2), labels, reduction="none") * mask
+            for owner, loss, count in zip(owners, token_loss.sum(dim=1).tolist(), mask.sum(dim=1).tolist()):
+                loss_sum[owner] += loss
+                token_count[owner] += count
+    # A text of 0 or 1 tokens has nothing to predict, so its perplexity is undefined (NaN)
+    perplexities = [
+        math.exp(loss / count) if count else float("nan")
+        for loss, count in zip(loss_sum, token_count)
+    ]
+    return perplexities[0] if single else perplexities
 
 #text = "The stars twinkle in the midnight sky."
 text = "blah blah"
-print(f"Perplexity: {calculate_perplexity(text):.2f}")
\ No newline at end of file
+print(f"Perplexity: {calculate_perplexity(text):.2f}")
+
+# Batch scoring
+samples = [text, "The stars twinkle in the midnight sky."]
+for sample, perplexity in zip(samples, calculate_perplexity(samples)):
+    print(f"Perplexity of {sample!r}: {perplexity:.2f}")
\ No newline at end of file
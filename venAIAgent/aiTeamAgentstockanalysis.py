@@ -1,3 +1,4 @@
+import hashlib
 from phi.agent import Agent
 from phi.model.groq import Groq
 from phi.model.openai import OpenAIChat
@@ -7,6 +8,21 @@ from phi.tools.duckduckgo import DuckDuckGo
 
 load_dotenv()
 
+# Near-miss company names (typos, casing) resolve locally instead of costing the agent another turn
+try:
+    from rapidfuzz import fuzz, process
+    USING_RAPIDFUZZ = True
+except ImportError:
+    import difflib
+    USING_RAPIDFUZZ = False
+
+company_symbols = {
+    "PhiData": "AAPL"            
+}
+# Lower-cased name -> symbol, built once for the fuzzy lookup
+_symbols_by_name = {name.lower(): symbol for name, symbol in company_symbols.items()}
+_company_names = list(_symbols_by_name)
+
 def get_company_symbol(company: str) -> str:
         """
         Use this function to get the stock symbol for a company.
@@ -17,10 +33,39 @@ def get_company_symbol(company: str) -> str:
         Returns:
             str: The symbol of the company.
         """        
-        company_symbols = {
-            "PhiData": "AAPL"            
-        }
-        return company_symbols.get(company, "Unknown")
+        symbol = company_symbols.get(company) or _symbols_by_name.get(company.lower())
+        if symbol:
+            return symbol
+        if USING_RAPIDFUZZ:
+            match = process.extractOne(company.lower(), _company_names, scorer=fuzz.WRatio, score_cutoff=85)
+            name = match[0] if match else None
+        else:
+            matches = difflib.get_close_matches(company.lower(), _company_names, n=1, cutoff=0.85)
+            name = matches[0] if matches else None
+        return _symbols_by_name[name] if name else "Unknown"
+
+# Answers are cached on disk for a few minutes per (model, prompt) when diskcache is installed,
+# so re-running the same question skips the LLM and market-data round-trips
+try:
+    import diskcache
+    _answer_cache = diskcache.Cache("./.agent_cache")
+    USING_DISKCACHE = True
+except ImportError:
+    USING_DISKCACHE = False
+
+ANSWER_CACHE_SECONDS = 300
+
+def ask(agent: Agent, prompt: str) -> str:
+        """Run the agent on a prompt, reusing a recent answer for the same model and prompt."""
+        key = hashlib.blake2b(f"{agent.model.id}\n{prompt}".encode()).hexdigest()
+        if USING_DISKCACHE:
+            answer = _answer_cache.get(key)
+            if answer is not None:
+                return answer
+        answer = agent.run(prompt).content
+        if USING_DISKCACHE:
+            _answer_cache.set(key, answer, expire=ANSWER_CACHE_SECONDS)
+        return answer
            
 
 print ("Stock Analysis Agent")
@@ -56,4 +101,4 @@ teamagents = Agent(team=[WebAgent],
                     show_tool_calls=False
                     #debug_mode=False,
                 )
-teamagents.print_response("Summarize included source and stock price for NVDA in table format", stream=True) 
\ No newline at end of file
+print(ask(teamagents, "Summarize included source and stock price for NVDA in table format")) 
\ No newline at end of file